@@ -0,0 +1,87 @@
+"""Order and balance state driven by user-data stream events."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict
+
+# Order statuses after which no further execution reports arrive.
+FINAL_STATUSES = {"FILLED", "CANCELED", "REJECTED", "EXPIRED", "EXPIRED_IN_MATCH"}
+
+
+@dataclass
+class OrderState:
+    order_id: int
+    symbol: str
+    side: str
+    status: str
+    filled_qty: float = 0.0
+    filled_quote: float = 0.0
+    commission: float = 0.0
+    commission_asset: str = ""
+    updated: int = 0  # exchange event time, ms
+
+    @property
+    def avg_price(self) -> float:
+        return self.filled_quote / self.filled_qty if self.filled_qty else 0.0
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINAL_STATUSES
+
+
+@dataclass
+class Balance:
+    asset: str
+    free: float
+    locked: float
+
+
+class AccountState:
+    """Apply ``executionReport`` and ``outboundAccountPosition`` events.
+
+    Partial fills accumulate per order; commissions are summed across fills.
+    """
+
+    def __init__(self) -> None:
+        self.orders: Dict[int, OrderState] = {}
+        self.balances: Dict[str, Balance] = {}
+        self._waiters: Dict[int, asyncio.Event] = {}
+
+    def apply(self, event: dict) -> None:
+        kind = event.get("e")
+        if kind == "executionReport":
+            self._on_execution(event)
+        elif kind == "outboundAccountPosition":
+            for b in event.get("B", []):
+                self.balances[b["a"]] = Balance(b["a"], float(b["f"]), float(b["l"]))
+
+    def _on_execution(self, e: dict) -> None:
+        order_id = int(e["i"])
+        order = self.orders.get(order_id)
+        if order is None:
+            order = self.orders[order_id] = OrderState(order_id, e["s"], e["S"], e["X"])
+        order.status = e["X"]
+        order.updated = int(e.get("E", 0))
+        if e.get("x") == "TRADE":
+            order.filled_qty = float(e["z"])
+            order.filled_quote = float(e.get("Z") or order.filled_quote + float(e["l"]) * float(e["L"]))
+            order.commission += float(e.get("n") or 0.0)
+            order.commission_asset = e.get("N") or order.commission_asset
+        if order.done and order_id in self._waiters:
+            self._waiters.pop(order_id).set()
+
+    def free(self, asset: str) -> float:
+        b = self.balances.get(asset)
+        return b.free if b else 0.0
+
+    async def wait_done(self, order_id: int, timeout: float) -> OrderState:
+        """Wait until ``order_id`` reaches a final status."""
+        order = self.orders.get(order_id)
+        if order is None or not order.done:
+            event = self._waiters.setdefault(order_id, asyncio.Event())
+            await asyncio.wait_for(event.wait(), timeout)
+        return self.orders[order_id]
+
+
+__all__ = ["AccountState", "Balance", "OrderState"]
@@ -1,43 +1,175 @@
 """Lightweight backtester for Fabio strategy."""
 from __future__ import annotations
 
-import pandas as pd
-from binance.client import Client
+import heapq
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional
 
-from .config import load_config
-from .symbols import fetch_symbol_filters, SymbolCache
+from .cache import ResultCache
+from .config import Config, load_config
+from .logger import get_logger, logger
+from .symbols import fetch_symbol_filters, SymbolCache, SymbolFilters
 from .executor import Executor
+from .features import FeatureTick, ensure_features, iter_features
 from .risk import RiskManager
 from .strategy import FabioStrategy
 from .portfolio import Portfolio
+from .ticks import DEFAULT_CHUNK_ROWS, Tick, read_ticks
 
 
-def backtest(csv_path: str, symbol: str) -> dict:
-    cfg = load_config()
-    client = Client()
-    filters = SymbolCache(fetch_symbol_filters(client, [symbol]))
-    executor = Executor(client, filters, cfg)
-    risk = RiskManager(cfg)
-    strategy = FabioStrategy(cfg, filters, executor, risk)
-    portfolio = Portfolio()
+def merge_ticks(files: Dict[str, str], chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[Tick]:
+    """K-way merge of per-symbol tick files in timestamp order.
+
+    Each symbol is streamed in chunks by :func:`read_ticks` (paths may be
+    globs) and ``heapq.merge`` keeps only the head tick of each stream on its
+    heap, so memory scales with the number of symbols rather than history
+    length.  ``ts`` must be numeric and ascending; ties are broken by the
+    order of ``files``.
+    """
+    streams = [read_ticks(path, symbol, chunk_rows) for symbol, path in files.items()]
+    return heapq.merge(*streams, key=lambda t: t.ts)
+
+
+def merge_features(files: Dict[str, str], chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[FeatureTick]:
+    """Like :func:`merge_ticks` but over memory-mapped feature stores.
+
+    Stores are built on first use and reused until the data or indicator
+    code changes; building raises ``OSError`` if they cannot be written.
+    """
+    streams = [
+        iter_features(ensure_features(path, symbol, chunk_rows), symbol, chunk_rows)
+        for symbol, path in files.items()
+    ]
+    return heapq.merge(*streams, key=lambda t: t.ts)
+
+
+def _tick_seconds(ts: float) -> float:
+    # Treat values beyond year ~2286 in seconds as milliseconds.
+    return ts / 1000 if ts > 1e10 else ts
+
+
+def _tick_time(ts: float) -> datetime:
+    return datetime.fromtimestamp(_tick_seconds(ts), timezone.utc)
+
+
+def backtest(csv_path: str, symbol: str, cache: Optional[ResultCache] = None) -> dict:
+    """Single-symbol backtest; returns the :meth:`Portfolio.summary` dict."""
+    return backtest_portfolio({symbol: csv_path}, cache=cache)["combined"]
 
-    df = pd.read_csv(csv_path)
-    for _, row in df.iterrows():
-        pos = strategy.on_tick(symbol, row["bid"], row["ask"], row.get("volume", 0))
-        # In backtest we may inspect positions after each tick
-        if pos is None:
-            continue
 
-    return portfolio.summary()
+def backtest_portfolio(
+    files: Dict[str, str],
+    cfg: Optional[Config] = None,
+    filters: Optional[Dict[str, SymbolFilters]] = None,
+    cache: Optional[ResultCache] = None,
+) -> dict:
+    """Replay one tick file per symbol through a single strategy and risk state.
+
+    ``files`` maps symbol to a CSV path or glob.  Entries and exits are recorded in a
+    per-symbol :class:`Portfolio` and a combined one so the shared
+    ``RiskManager`` limits can be evaluated across the whole watchlist.  The
+    combined trade ledger is returned under ``"trades"``.
+
+    With a ``cache``, a previous result for the same tick data, config,
+    filters and strategy code is returned without replaying.
+    """
+    cfg = replace(cfg or load_config(), WATCHLIST=list(files))
+    # Simulated fills never touch the exchange; only fetch filters if needed.
+    if filters is None:
+        from binance.client import Client
+
+        client = Client()
+        filters = fetch_symbol_filters(client, cfg.WATCHLIST)
+
+    key = None
+    if cache is not None:
+        key = cache.key(files, cfg, filters)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    get_logger(cfg)
+    symbols = SymbolCache(filters)
+    executor = Executor(symbols, cfg)
+    # cooldowns and the drawdown stop run on replayed time, not wall-clock
+    now = 0.0
+    risk = RiskManager(cfg, clock=lambda: now)
+    strategy = FabioStrategy(cfg, symbols, executor, risk)
+
+    books = {s: Portfolio() for s in files}
+    combined = Portfolio()
+    ticks = 0
+    max_open = 0
+
+    use_features = cfg.BACKTEST_FEATURES
+    if use_features:
+        try:
+            stream = merge_features(files, cfg.BACKTEST_CHUNK_ROWS)
+        except OSError as exc:
+            # e.g. a read-only or shared data directory
+            logger.warning(f"[FEATURES] cannot build feature store, replaying ticks: {exc}")
+            use_features = False
+    if not use_features:
+        stream = merge_ticks(files, cfg.BACKTEST_CHUNK_ROWS)
+
+    for tick in stream:
+        ticks += 1
+        now = _tick_seconds(tick.ts)
+        symbol = tick.symbol
+        held = strategy.positions.for_symbol(symbol)
+        if not use_features:
+            pos = strategy.on_tick(symbol, tick.bid, tick.ask, tick.volume)
+        elif tick.score is not None:
+            pos = strategy.decide(symbol, tick.bid, tick.ask, tick.macd_hist, tick.score)
+        else:
+            pos = None
+
+        fills = []
+        if pos is not None:
+            fills.append((executor.simulate(symbol, "BUY", pos.qty, tick.ask), 0.0))
+        mid = (tick.bid + tick.ask) / 2
+        for closed in held:
+            if closed not in strategy.positions:
+                fill = executor.simulate(symbol, "SELL", closed.qty, mid)
+                fills.append((fill, strategy.exit_pnl(closed, mid)))
+        if fills:
+            ts = _tick_time(tick.ts)
+            for fill, pnl in fills:
+                books[symbol].record(fill, pnl, ts)
+                combined.record(fill, pnl, ts)
+        max_open = max(max_open, len(strategy.positions))
+
+    result = {
+        "ticks": ticks,
+        "symbols": {s: p.summary() for s, p in books.items()},
+        "combined": combined.summary(),
+        "day_pnl": risk.day_pnl,
+        "max_drawdown": risk.max_drawdown,
+        "max_open_positions": max_open,
+        "trades": combined.trades,
+    }
+    if cache is not None:
+        cache.put(key, result)
+    return result
 
 
 if __name__ == "__main__":
     import sys
 
-    csv_file = sys.argv[1]
-    symbol = sys.argv[2]
-    summary = backtest(csv_file, symbol)
+    cfg = load_config()
+    cache = ResultCache.from_config(cfg) if cfg.BACKTEST_CACHE_MB > 0 else None
+    if sys.argv[1] == "--portfolio":
+        pairs = (arg.split("=", 1) for arg in sys.argv[2:])
+        summary = backtest_portfolio({s.upper(): path for s, path in pairs}, cfg, cache=cache)
+        summary = {k: v for k, v in summary.items() if k != "trades"}
+    else:
+        csv_file = sys.argv[1]
+        symbol = sys.argv[2]
+        summary = backtest(csv_file, symbol, cache=cache)
     print(summary)
+    if cache is not None:
+        print("[CACHE] " + " ".join(f"{k}={v}" for k, v in cache.stats().items()))
 
 
-__all__ = ["backtest"]
+__all__ = ["backtest", "backtest_portfolio", "merge_features", "merge_ticks"]
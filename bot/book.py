@@ -0,0 +1,115 @@
+"""Open position book with sorted price-trigger indexes."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterator, List, Tuple
+
+from .risk import Position
+
+_Index = List[Tuple[float, int]]
+
+
+def _discard(index: _Index, key: Tuple[float, int]) -> None:
+    i = bisect_left(index, key)
+    if i < len(index) and index[i] == key:
+        del index[i]
+
+
+class PositionBook:
+    """Long positions keyed by id, bounded by ``max_open``.
+
+    Several positions may be open per symbol (scale-ins).  Stops, take
+    profits and entry prices are kept in per-symbol sorted lists of
+    ``(level, pid)`` so a tick only visits positions whose levels were
+    crossed.
+    """
+
+    def __init__(self, max_open: int):
+        self.max_open = max_open
+        self._next_pid = 1
+        self._positions: Dict[int, Position] = {}
+        self._by_symbol: Dict[str, Dict[int, Position]] = {}
+        self._stops: Dict[str, _Index] = {}
+        self._tps: Dict[str, _Index] = {}
+        self._entries: Dict[str, _Index] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[Position]:
+        return iter(list(self._positions.values()))
+
+    def __contains__(self, item: object) -> bool:
+        if isinstance(item, Position):
+            return self._positions.get(item.pid) is item
+        return bool(self._by_symbol.get(item))
+
+    @property
+    def full(self) -> bool:
+        return len(self._positions) >= self.max_open
+
+    def for_symbol(self, symbol: str) -> List[Position]:
+        return list(self._by_symbol.get(symbol, {}).values())
+
+    def last_entry(self, symbol: str) -> Position | None:
+        """Most recently added open position on ``symbol``."""
+        symbol_book = self._by_symbol.get(symbol)
+        return next(reversed(symbol_book.values())) if symbol_book else None
+
+    def add(self, pos: Position) -> bool:
+        """Index ``pos``; return ``False`` if the book is full.
+
+        Positions without a ``pid`` are assigned one; restored positions keep
+        theirs.
+        """
+        if self.full:
+            return False
+        if not pos.pid:
+            pos.pid = self._next_pid
+        self._next_pid = max(self._next_pid, pos.pid + 1)
+        self._positions[pos.pid] = pos
+        self._by_symbol.setdefault(pos.symbol, {})[pos.pid] = pos
+        insort(self._stops.setdefault(pos.symbol, []), (pos.stop, pos.pid))
+        insort(self._tps.setdefault(pos.symbol, []), (pos.take_profit, pos.pid))
+        insort(self._entries.setdefault(pos.symbol, []), (pos.entry_price, pos.pid))
+        return True
+
+    def remove(self, pos: Position) -> None:
+        del self._positions[pos.pid]
+        symbol_book = self._by_symbol[pos.symbol]
+        del symbol_book[pos.pid]
+        if not symbol_book:
+            del self._by_symbol[pos.symbol]
+        _discard(self._stops[pos.symbol], (pos.stop, pos.pid))
+        _discard(self._tps[pos.symbol], (pos.take_profit, pos.pid))
+        _discard(self._entries[pos.symbol], (pos.entry_price, pos.pid))
+
+    def reduce(self, pos: Position, qty: float) -> None:
+        """Partially exit ``pos``; it is removed once nothing is left."""
+        pos.qty = max(pos.qty - qty, 0.0)
+        if pos.qty <= 0:
+            self.remove(pos)
+
+    def move_stop(self, pos: Position, stop: float) -> None:
+        index = self._stops[pos.symbol]
+        _discard(index, (pos.stop, pos.pid))
+        pos.stop = stop
+        insort(index, (stop, pos.pid))
+
+    def triggered(self, symbol: str, price: float) -> List[Position]:
+        """Positions whose stop (``stop >= price``) or take profit
+        (``take_profit <= price``) was crossed at ``price``."""
+        stops = self._stops.get(symbol, [])
+        tps = self._tps.get(symbol, [])
+        pids = [pid for _, pid in stops[bisect_left(stops, (price,)):]]
+        pids += [pid for _, pid in tps[: bisect_right(tps, (price, float("inf")))]]
+        return [self._positions[pid] for pid in dict.fromkeys(pids)]
+
+    def in_profit(self, symbol: str, price: float, min_bps: float) -> List[Position]:
+        """Positions whose gain at ``price`` exceeds ``min_bps``."""
+        entries = self._entries.get(symbol, [])
+        limit = price / (1 + min_bps / 10000)
+        return [self._positions[pid] for _, pid in entries[: bisect_left(entries, (limit,))]]
+
+
+__all__ = ["PositionBook"]
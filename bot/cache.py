@@ -0,0 +1,162 @@
+"""Content-addressed cache of backtest results."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Optional
+
+from .config import Config
+from .fileio import atomic_pickle
+from .symbols import SymbolFilters
+from .ticks import expand_paths
+
+# Config fields that cannot change a simulated run.
+_IGNORED_FIELDS = {
+    "BINANCE_API_KEY",
+    "BINANCE_API_SECRET",
+    "LIVE",
+    "DEBUG",
+    "DRY_LOG_TRADES_ONLY",
+    "WATCHLIST",
+    "TELEGRAM_BOT_TOKEN",
+    "TELEGRAM_CHAT_ID",
+    "BACKTEST_CHUNK_ROWS",
+    "BACKTEST_CACHE_DIR",
+    "BACKTEST_CACHE_MB",
+    "BACKTEST_FEATURES",
+    "CHECKPOINT_PATH",
+    "CHECKPOINT_SEC",
+    "CHECKPOINT_MAX_AGE_SEC",
+    "BINANCE_WS",
+    "BINANCE_REST",
+    "BINANCE_WS_USER",
+    "REST_WEIGHT_LIMIT",
+    "METRICS_HOST",
+    "METRICS_PORT",
+    "JOURNAL_PATH",
+}
+
+# Modules whose source determines backtest output.
+_CODE_MODULES = (
+    "backtest", "book", "executor", "features", "indicators", "portfolio", "risk", "scoring", "strategy",
+    "symbols", "ticks",
+)
+
+_code_version: Optional[str] = None
+
+
+def code_version() -> str:
+    """Hash of the strategy and simulation sources."""
+    global _code_version
+    if _code_version is None:
+        h = hashlib.blake2b(digest_size=16)
+        pkg = Path(__file__).parent
+        for name in _CODE_MODULES:
+            h.update((pkg / f"{name}.py").read_bytes())
+        _code_version = h.hexdigest()
+    return _code_version
+
+
+class ResultCache:
+    """Pickled backtest results under ``root``, evicted LRU once over ``max_bytes``.
+
+    Keys hash the tick file contents, the simulation-relevant ``Config``
+    fields, the symbol filters and :func:`code_version`.  File digests are
+    memoised by path, size and mtime so unchanged inputs are not re-read.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._digest_index = self.root / "digests.json"
+        self._digests: Optional[Dict[str, list]] = None
+
+    @classmethod
+    def from_config(cls, cfg: Config) -> "ResultCache":
+        return cls(cfg.BACKTEST_CACHE_DIR, int(cfg.BACKTEST_CACHE_MB * 1024 * 1024))
+
+    # --- keys ------------------------------------------------------------
+
+    def file_digest(self, path: str) -> str:
+        if self._digests is None:
+            try:
+                self._digests = json.loads(self._digest_index.read_text())
+            except (OSError, ValueError):
+                self._digests = {}
+        st = os.stat(path)
+        ident = os.path.abspath(path)
+        memo = self._digests.get(ident)
+        if memo and memo[0] == st.st_size and memo[1] == st.st_mtime_ns:
+            return memo[2]
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        self._digests[ident] = [st.st_size, st.st_mtime_ns, digest]
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._digest_index.write_text(json.dumps(self._digests))
+        return digest
+
+    def key(self, files: Dict[str, str], cfg: Config, filters: Dict[str, SymbolFilters]) -> str:
+        params = {k: v for k, v in asdict(cfg).items() if k not in _IGNORED_FIELDS}
+        payload = {
+            "code": code_version(),
+            "config": params,
+            # a list, not a dict: sort_keys would drop the order merge_ticks breaks ties by
+            "data": [(s, [self.file_digest(p) for p in expand_paths(path)]) for s, path in files.items()],
+            "filters": {s: asdict(f) for s, f in sorted(filters.items())},
+        }
+        blob = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(blob, digest_size=20).hexdigest()
+
+    # --- storage ---------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (FileNotFoundError, pickle.UnpicklingError, EOFError):
+            self.misses += 1
+            return None
+        os.utime(path)  # mtime doubles as last-access time for LRU
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: dict) -> None:
+        atomic_pickle(str(self._path(key)), value)
+        self._evict()
+
+    def _entries(self) -> list:
+        return [(p.stat().st_mtime_ns, p.stat().st_size, p) for p in self.root.glob("*.pkl")]
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def stats(self) -> dict:
+        entries = self._entries() if self.root.exists() else []
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
+
+
+__all__ = ["ResultCache", "code_version"]
@@ -0,0 +1,101 @@
+"""Strategy state checkpoints for warm restarts."""
+from __future__ import annotations
+
+import asyncio
+import copy
+import pickle
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Optional
+
+from .fileio import atomic_pickle
+from .logger import logger
+from .strategy import FabioStrategy
+
+CHECKPOINT_VERSION = 3
+
+
+def _utc_date(ts: float):
+    return datetime.fromtimestamp(ts, timezone.utc).date()
+
+
+def snapshot(strategy: FabioStrategy) -> dict:
+    """Copy the restartable strategy state.
+
+    Indicator state is a handful of floats plus the MA window per symbol, so
+    the copy is cheap enough to take on the event loop and serialisation can
+    run elsewhere.
+    """
+    risk = strategy.risk
+    return {
+        "version": CHECKPOINT_VERSION,
+        "saved_at": time.time(),
+        "indicators": copy.deepcopy(strategy.indicators),
+        "positions": [replace(p) for p in strategy.positions],
+        "decision_memo": dict(strategy._decision_memo),
+        "risk": {
+            "day_pnl": risk.day_pnl,
+            "max_drawdown": risk.max_drawdown,
+            "cooldown_until": risk.cooldown_until,
+        },
+    }
+
+
+def restore(strategy: FabioStrategy, state: dict) -> None:
+    """Load ``state`` into a freshly constructed strategy.
+
+    Indicator state is restored only for symbols still on the watchlist and
+    only if the checkpoint is at most ``CHECKPOINT_MAX_AGE_SEC`` old; staler
+    state would score the first ticks on a window that no longer matches the
+    market.  Daily risk figures are discarded if the checkpoint is from a
+    previous UTC day.  Open positions are always restored.
+    """
+    age = time.time() - state["saved_at"]
+    if age <= strategy.config.CHECKPOINT_MAX_AGE_SEC:
+        for symbol, indicators in state["indicators"].items():
+            if symbol in strategy.indicators:
+                strategy.indicators[symbol] = indicators
+        strategy._decision_memo.update(state["decision_memo"])
+    else:
+        strategy.logger.info(f"[RESTORE] checkpoint is {age:.0f}s old; indicators warm up again")
+    for pos in state["positions"]:
+        if not strategy.positions.add(pos):
+            strategy.logger.warning(f"[RESTORE] dropped {pos.symbol} pid={pos.pid}: book full")
+    if _utc_date(state["saved_at"]) == _utc_date(time.time()):
+        for key, value in state["risk"].items():
+            setattr(strategy.risk, key, value)
+
+
+def save(path: str, state: dict) -> None:
+    """Pickle ``state`` to ``path`` atomically via a temp file and rename."""
+    atomic_pickle(path, state)
+
+
+def load(path: str) -> Optional[dict]:
+    """Return the checkpoint at ``path`` or ``None`` if missing or unusable.
+
+    Pickles whose classes were renamed or changed shape since they were
+    written are unusable too.
+    """
+    try:
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError) as exc:
+        logger.warning(f"[RESTORE] ignoring unreadable checkpoint {path}: {exc!r}")
+        return None
+    if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+        return None
+    return state
+
+
+async def checkpoint_loop(strategy: FabioStrategy, path: str, interval: float) -> None:
+    """Periodically snapshot on the loop and write from a worker thread."""
+    while True:
+        await asyncio.sleep(interval)
+        await asyncio.to_thread(save, path, snapshot(strategy))
+
+
+__all__ = ["checkpoint_loop", "load", "restore", "save", "snapshot"]
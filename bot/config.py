@@ -35,6 +35,8 @@ class Config:
     MIN_NOTIONAL_USDT: float = 5.0
     COOLDOWN_SEC: int = 15
     MAX_OPEN_TRADES: int = 1
+    MAX_SCALE_INS: int = 0  # extra positions per symbol on top of the first
+    SCALE_IN_BPS: float = 20.0  # rise above the last entry before adding
     SLIPPAGE_BPS: float = 2.0
 
     ENTRY_MIN_GRADE: str = "B"
@@ -44,6 +46,25 @@ class Config:
     TELEGRAM_BOT_TOKEN: str | None = None
     TELEGRAM_CHAT_ID: str | None = None
 
+    BACKTEST_CHUNK_ROWS: int = 100_000
+    BACKTEST_CACHE_DIR: str = ".cache/backtest"
+    BACKTEST_CACHE_MB: float = 512.0  # 0 disables the result cache
+    BACKTEST_FEATURES: bool = True
+
+    CHECKPOINT_PATH: str = "state/checkpoint.pkl"
+    CHECKPOINT_SEC: float = 5.0
+    CHECKPOINT_MAX_AGE_SEC: float = 300.0  # older indicator state is discarded
+
+    BINANCE_WS: str = "wss://stream.binance.com:9443/stream"
+    BINANCE_REST: str = "https://api.binance.com"
+    BINANCE_WS_USER: str = "wss://stream.binance.com:9443/ws"  # listen keys come from BINANCE_REST
+    REST_WEIGHT_LIMIT: int = 6000  # request weight per minute
+
+    METRICS_HOST: str = "127.0.0.1"
+    METRICS_PORT: int = 9108  # 0 disables the endpoint
+
+    JOURNAL_PATH: str = "state/journal.db"  # empty disables the journal
+
 
 def _bool(env: os._Environ[str], key: str, default: bool) -> bool:
     return env.get(key, str(default)).lower() in {"1", "true", "yes", "on"}
@@ -82,12 +103,28 @@ def load_config() -> Config:
         MIN_NOTIONAL_USDT=_float(env, "MIN_NOTIONAL_USDT", 5.0),
         COOLDOWN_SEC=int(env.get("COOLDOWN_SEC", 15)),
         MAX_OPEN_TRADES=int(env.get("MAX_OPEN_TRADES", 1)),
+        MAX_SCALE_INS=int(env.get("MAX_SCALE_INS", 0)),
+        SCALE_IN_BPS=_float(env, "SCALE_IN_BPS", 20.0),
         SLIPPAGE_BPS=_float(env, "SLIPPAGE_BPS", 2.0),
         TELEGRAM_BOT_TOKEN=env.get("TELEGRAM_BOT_TOKEN"),
         TELEGRAM_CHAT_ID=env.get("TELEGRAM_CHAT_ID"),
         ENTRY_MIN_GRADE=env.get("ENTRY_MIN_GRADE", "B").upper(),
         ENTRY_MIN_SCORE=_float(env, "ENTRY_MIN_SCORE", 0.0),
         RISK_UNIT=env.get("RISK_UNIT", "bps").lower(),
+        BACKTEST_CHUNK_ROWS=int(env.get("BACKTEST_CHUNK_ROWS", 100_000)),
+        BACKTEST_CACHE_DIR=env.get("BACKTEST_CACHE_DIR", ".cache/backtest"),
+        BACKTEST_CACHE_MB=_float(env, "BACKTEST_CACHE_MB", 512.0),
+        BACKTEST_FEATURES=_bool(env, "BACKTEST_FEATURES", True),
+        CHECKPOINT_PATH=env.get("CHECKPOINT_PATH", "state/checkpoint.pkl"),
+        CHECKPOINT_SEC=_float(env, "CHECKPOINT_SEC", 5.0),
+        CHECKPOINT_MAX_AGE_SEC=_float(env, "CHECKPOINT_MAX_AGE_SEC", 300.0),
+        BINANCE_WS=env.get("BINANCE_WS", "wss://stream.binance.com:9443/stream"),
+        BINANCE_REST=env.get("BINANCE_REST", "https://api.binance.com"),
+        BINANCE_WS_USER=env.get("BINANCE_WS_USER", "wss://stream.binance.com:9443/ws"),
+        REST_WEIGHT_LIMIT=int(env.get("REST_WEIGHT_LIMIT", 6000)),
+        METRICS_HOST=env.get("METRICS_HOST", "127.0.0.1"),
+        METRICS_PORT=int(env.get("METRICS_PORT", 9108)),
+        JOURNAL_PATH=env.get("JOURNAL_PATH", "state/journal.db"),
 
     )
 
@@ -6,20 +6,19 @@ quantisation so we never accidentally round *up* and violate filters.
 """
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_DOWN
-from typing import Dict, Tuple
-"""Order execution and simulation layer."""
-from __future__ import annotations
-
-from dataclasses import dataclass
-from typing import Dict
-
-from binance.client import Client
+from typing import TYPE_CHECKING, Dict, Tuple
 
+from .account import AccountState
 from .config import Config
+from .logger import logger
+from .metrics import METRICS
 from .symbols import SymbolCache, SymbolFilters
-from .symbols import SymbolCache
+
+if TYPE_CHECKING:
+    from .rest import RestScheduler
 
 
 @dataclass
@@ -86,35 +85,60 @@ def size_position(symbol: str, px: float, cfg: Config, filters: Dict[str, Symbol
 
 
 class Executor:
-    def __init__(self, client: Client, symbols: SymbolCache, config: Config):
-        self.client = client
+    def __init__(
+        self,
+        symbols: SymbolCache,
+        config: Config,
+        account: AccountState | None = None,
+        rest: RestScheduler | None = None,
+    ):
         self.symbols = symbols
         self.config = config
+        self.account = account
+        self.rest = rest
 
     def _calc_fee(self, notional: float) -> float:
         return notional * self.config.FEE_TAKER
 
     def simulate(self, symbol: str, side: str, qty: float, price: float) -> ExecutionResult:
-
+        """Price a fill at ``price``; callers that place the order count it."""
         price = self.symbols.format_price(symbol, price)
         qty = self.symbols.format_qty(symbol, qty)
         notional = qty * price
         fee = self._calc_fee(notional)
         return ExecutionResult(symbol, side, qty, price, notional, fee, executed=False)
 
-    def market_order(self, symbol: str, side: str, qty: float) -> ExecutionResult:
-        if not self.config.LIVE:
-            ticker = self.client.get_symbol_ticker(symbol=symbol)
-            price = float(ticker["price"])
-            return self.simulate(symbol, side, qty, price)
+    async def market_order(self, symbol: str, side: str, qty: float, timeout: float = 10.0) -> ExecutionResult:
+        """Market order routed through the weight-aware REST scheduler.
 
-        order = self.client.create_order(symbol=symbol, side=side, type="MARKET", quantity=qty)
-        fills = order.get("fills", [{}])
-        price = float(fills[0].get("price", order.get("price", 0)))
-        executed_qty = float(order.get("executedQty", qty))
-        notional = executed_qty * price
-        fee = sum(float(f["commission"]) for f in fills)
-        return ExecutionResult(symbol, side, executed_qty, price, notional, fee, executed=True)
+        Paper mode prices a simulated fill from the (coalesced) ticker.  Live
+        orders only ask for an ACK; price, quantity and commission come from
+        ``executionReport`` events applied to ``self.account``.  A live order
+        that ends without filling returns ``executed=False`` and zero qty.
+        """
+        if self.rest is None:
+            raise RuntimeError("orders are placed through a RestScheduler; none configured")
+        if not self.config.LIVE:
+            ticker = await self.rest.get_symbol_ticker(symbol)
+            METRICS.observe_order(side, "sim")
+            return self.simulate(symbol, side, qty, float(ticker["price"]))
+        if self.account is None:
+            raise RuntimeError("live orders need the user-data AccountState for fills")
+
+        started = time.perf_counter()
+        ack = await self.rest.create_order(
+            symbol=symbol, side=side, type="MARKET", quantity=qty, newOrderRespType="ACK"
+        )
+        order = await self.account.wait_done(int(ack["orderId"]), timeout)
+        METRICS.observe_order(side, "live", time.perf_counter() - started)
+        # REJECTED, EXPIRED and CANCELED orders may end without any fill
+        executed = order.filled_qty > 0
+        if not executed:
+            logger.warning(f"[ORDER] {symbol} {side} qty={qty} ended {order.status} without a fill")
+        notional = order.filled_quote
+        return ExecutionResult(
+            symbol, side, order.filled_qty, order.avg_price, notional, order.commission, executed=executed
+        )
 
 
 __all__ = [
@@ -127,5 +151,3 @@ __all__ = [
     "notional_ok",
     "size_position",
 ]
-
-__all__ = ["Executor", "ExecutionResult"]
@@ -0,0 +1,161 @@
+"""Precomputed indicator and score columns for replayed tick data.
+
+Building features runs every tick of a symbol's files through
+:class:`IndicatorState` and :func:`score_tick` once and writes one raw
+float64 column file per feature under ``.features/<file>/<key>/`` next to
+the data.  Later backtests memory-map those columns and call
+:meth:`FabioStrategy.decide` directly, skipping indicator work.
+
+The key covers the input files (path, size, mtime), the indicator and
+scoring sources and the warm-up length, so a stale store is never reused.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, NamedTuple, Optional
+
+from . import indicators, scoring
+from .indicators import IndicatorState
+from .scoring import ScoreResult
+from .strategy import WARMUP_TICKS, score_tick
+from .ticks import DEFAULT_CHUNK_ROWS, expand_paths, read_ticks
+
+if TYPE_CHECKING:
+    import numpy as np
+
+COLUMNS = ("ts", "bid", "ask", "volume", "macd_hist", "score", "grade")
+_GRADES = {"A": 3.0, "B": 2.0, "C": 1.0}
+_GRADE_NAMES = {v: k for k, v in _GRADES.items()}
+
+
+class FeatureTick(NamedTuple):
+    ts: float
+    symbol: str
+    bid: float
+    ask: float
+    volume: float
+    macd_hist: float
+    score: Optional[ScoreResult]  # None during warm-up
+
+
+def feature_key(pattern: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for path in expand_paths(pattern):
+        st = os.stat(path)
+        h.update(f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    h.update(Path(indicators.__file__).read_bytes())
+    h.update(Path(scoring.__file__).read_bytes())
+    h.update(inspect.getsource(score_tick).encode())
+    h.update(str(WARMUP_TICKS).encode())
+    return h.hexdigest()
+
+
+def feature_dir(pattern: str) -> Path:
+    first = Path(expand_paths(pattern)[0])
+    return first.parent / ".features" / first.name / feature_key(pattern)
+
+
+def build_features(pattern: str, symbol: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Path:
+    """Compute and write feature columns for ``pattern``; return their directory."""
+    target = feature_dir(pattern)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # unique per builder so parallel workers on one file never share it
+    tmp = Path(tempfile.mkdtemp(dir=target.parent, prefix=target.name + ".", suffix=".tmp"))
+    try:
+        _write_columns(tmp, pattern, symbol, chunk_rows)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    # builds for older inputs or code are never read again; temp dirs may
+    # belong to builders still running
+    for stale in target.parent.iterdir():
+        if stale.name != target.name and not stale.name.endswith(".tmp"):
+            shutil.rmtree(stale, ignore_errors=True)
+    try:
+        os.replace(tmp, target)
+    except OSError:
+        if not target.exists():
+            raise
+        # another builder published the same key first; its columns are identical
+        shutil.rmtree(tmp, ignore_errors=True)
+    return target
+
+
+def _write_columns(tmp: Path, pattern: str, symbol: str, chunk_rows: int) -> None:
+    import numpy as np
+
+    files = {c: open(tmp / f"{c}.f64", "wb") for c in COLUMNS}
+    buffers: Dict[str, list] = {c: [] for c in COLUMNS}
+    state = IndicatorState()
+    rows = 0
+
+    def _flush() -> None:
+        for c in COLUMNS:
+            files[c].write(np.asarray(buffers[c], dtype="<f8").tobytes())
+            buffers[c].clear()
+
+    try:
+        for tick in read_ticks(pattern, symbol, chunk_rows):
+            state.update((tick.bid + tick.ask) / 2, tick.volume)
+            if state.count >= WARMUP_TICKS:
+                res = score_tick(symbol, tick.bid, tick.ask, state)
+                score, grade = res.score, _GRADES[res.grade]
+            else:
+                score = grade = float("nan")
+            for c, v in zip(COLUMNS, (tick.ts, tick.bid, tick.ask, tick.volume, state.macd_hist, score, grade)):
+                buffers[c].append(v)
+            rows += 1
+            if len(buffers["ts"]) >= chunk_rows:
+                _flush()
+        _flush()
+    finally:
+        for f in files.values():
+            f.close()
+
+    (tmp / "meta.json").write_text(json.dumps({"symbol": symbol, "rows": rows, "columns": COLUMNS}))
+
+
+def load_features(pattern: str) -> Optional[Dict[str, "np.ndarray"]]:
+    """Memory-map the feature columns for ``pattern`` if an up-to-date store exists."""
+    import numpy as np
+
+    path = feature_dir(pattern)
+    try:
+        meta = json.loads((path / "meta.json").read_text())
+    except (OSError, ValueError):
+        return None
+    rows = meta["rows"]
+    if rows == 0:
+        return {c: np.empty(0) for c in COLUMNS}
+    return {c: np.memmap(path / f"{c}.f64", dtype="<f8", mode="r", shape=(rows,)) for c in COLUMNS}
+
+
+def ensure_features(pattern: str, symbol: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Dict[str, "np.ndarray"]:
+    cols = load_features(pattern)
+    if cols is None:
+        build_features(pattern, symbol, chunk_rows)
+        cols = load_features(pattern)
+    return cols
+
+
+def iter_features(
+    cols: Dict[str, "np.ndarray"], symbol: str, chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Iterator[FeatureTick]:
+    """Yield :class:`FeatureTick` rows, converting ``chunk_rows`` at a time."""
+    total = len(cols["ts"])
+    for start in range(0, total, chunk_rows):
+        stop = min(start + chunk_rows, total)
+        chunk = [cols[c][start:stop].tolist() for c in COLUMNS]
+        for ts, bid, ask, volume, hist, score, grade in zip(*chunk):
+            result = ScoreResult(symbol, score, _GRADE_NAMES[grade], {}) if grade == grade else None
+            yield FeatureTick(ts, symbol, bid, ask, volume, hist, result)
+
+
+__all__ = ["COLUMNS", "FeatureTick", "build_features", "ensure_features", "feature_dir", "iter_features", "load_features"]
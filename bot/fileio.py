@@ -0,0 +1,31 @@
+"""Small file helpers shared by checkpoints and caches."""
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def atomic_pickle(path: str, obj: Any) -> None:
+    """Pickle ``obj`` to ``path`` via a unique temp file and rename.
+
+    Readers see either the old or the new file, and concurrent writers of
+    the same path do not share a temp file.
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=target.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+__all__ = ["atomic_pickle"]
@@ -0,0 +1,86 @@
+"""Run several strategy variants over one feed and one indicator state."""
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING, Dict, List
+
+from .config import Config
+from .executor import Executor
+from .indicators import IndicatorState
+from .portfolio import Portfolio
+from .risk import RiskManager
+from .scoring import ScoreResult
+from .strategy import WARMUP_TICKS, FabioStrategy, score_tick
+from .symbols import SymbolCache
+
+if TYPE_CHECKING:
+    from .rest import RestScheduler
+
+
+class Variant:
+    """One strategy configuration with its own positions, risk and portfolio."""
+
+    def __init__(self, name: str, config: Config, symbols: SymbolCache, rest: RestScheduler | None = None):
+        self.name = name
+        self.config = config
+        self.executor = Executor(symbols, config, rest=rest)
+        self.risk = RiskManager(config)
+        # the host owns indicator state; the variant's own stays empty
+        self.strategy = FabioStrategy(replace(config, WATCHLIST=[]), symbols, self.executor, self.risk)
+        self.portfolio = Portfolio()
+
+    def step(self, symbol: str, bid: float, ask: float, hist_val: float, score: ScoreResult) -> None:
+        held = self.strategy.positions.for_symbol(symbol)
+        pos = self.strategy.decide(symbol, bid, ask, hist_val, score)
+        if pos is not None:
+            self.portfolio.record(self.executor.simulate(symbol, "BUY", pos.qty, ask))
+        mid = (bid + ask) / 2
+        for closed in held:
+            if closed not in self.strategy.positions:
+                fill = self.executor.simulate(symbol, "SELL", closed.qty, mid)
+                self.portfolio.record(fill, self.strategy.exit_pnl(closed, mid))
+
+    def summary(self) -> dict:
+        return {
+            **self.portfolio.summary(),
+            "open": len(self.strategy.positions),
+            "day_pnl": self.risk.day_pnl,
+            "max_drawdown": self.risk.max_drawdown,
+        }
+
+
+class StrategyHost:
+    """Feed each tick once into shared indicators, then to every variant.
+
+    ``variants`` maps a name to ``Config`` field overrides applied on top of
+    ``base``.  Indicator updates and scoring do not depend on the variant
+    config, so each extra variant only costs its :meth:`FabioStrategy.decide`.
+    """
+
+    def __init__(
+        self,
+        base: Config,
+        symbols: SymbolCache,
+        variants: Dict[str, dict],
+        rest: RestScheduler | None = None,
+    ):
+        self.indicators: Dict[str, IndicatorState] = {s: IndicatorState() for s in base.WATCHLIST}
+        self.variants: List[Variant] = [
+            Variant(name, replace(base, **overrides), symbols, rest) for name, overrides in variants.items()
+        ]
+
+    def on_tick(self, symbol: str, bid: float, ask: float, volume: float = 0.0) -> None:
+        state = self.indicators[symbol]
+        state.update((bid + ask) / 2, volume)
+        if state.count < WARMUP_TICKS:
+            return
+        score = score_tick(symbol, bid, ask, state)
+        hist_val = state.macd_hist
+        for variant in self.variants:
+            variant.step(symbol, bid, ask, hist_val, score)
+
+    def summary(self) -> Dict[str, dict]:
+        return {v.name: v.summary() for v in self.variants}
+
+
+__all__ = ["StrategyHost", "Variant"]
@@ -1,7 +1,18 @@
-"""Technical indicators used by Fabio strategy."""
+"""Technical indicators used by Fabio strategy.
+
+The series functions operate on pandas objects and are meant for offline
+work such as backtests.  :class:`IndicatorState` computes the same values
+incrementally in pure Python for the live tick path, so the bot does not
+need pandas at runtime.
+"""
 from __future__ import annotations
 
-import pandas as pd
+import math
+from collections import deque
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def ema(series: pd.Series, period: int) -> pd.Series:
@@ -36,4 +47,99 @@ def vwap(df: pd.DataFrame) -> pd.Series:
     return pv / vol
 
 
-__all__ = ["ema", "ma", "rsi", "macd", "vwap"]
+class EMA:
+    """Incremental ``ewm(span=period, adjust=False).mean()``."""
+
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, period: int):
+        self.alpha = 2 / (period + 1)
+        self.value: Optional[float] = None
+
+    def update(self, x: float) -> float:
+        if self.value is None:
+            self.value = x
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+
+class IndicatorState:
+    """Per-symbol running RSI, MACD histogram, moving average and VWAP.
+
+    Each :meth:`update` is O(1) and matches the last value of the series
+    functions above applied to the full tick history.  Values that are not
+    defined yet are ``nan``.
+    """
+
+    __slots__ = (
+        "count", "last_price", "ema_up", "ema_down", "ema_fast", "ema_slow",
+        "ema_signal", "window", "window_sum", "pv", "volume",
+    )
+
+    def __init__(
+        self,
+        rsi_period: int = 14,
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
+        ma_period: int = 200,
+    ):
+        self.count = 0
+        self.last_price: Optional[float] = None
+        self.ema_up = EMA(rsi_period)
+        self.ema_down = EMA(rsi_period)
+        self.ema_fast = EMA(fast)
+        self.ema_slow = EMA(slow)
+        self.ema_signal = EMA(signal)
+        self.window: deque = deque(maxlen=ma_period)
+        self.window_sum = 0.0
+        self.pv = 0.0
+        self.volume = 0.0
+
+    def update(self, price: float, volume: float = 0.0) -> None:
+        if self.last_price is not None:
+            delta = price - self.last_price
+            self.ema_up.update(max(delta, 0.0))
+            self.ema_down.update(max(-delta, 0.0))
+        self.last_price = price
+        self.count += 1
+
+        macd_line = self.ema_fast.update(price) - self.ema_slow.update(price)
+        self.ema_signal.update(macd_line)
+
+        if len(self.window) == self.window.maxlen:
+            self.window_sum -= self.window[0]
+        self.window.append(price)
+        self.window_sum += price
+
+        self.pv += price * volume
+        self.volume += volume
+
+    @property
+    def rsi(self) -> float:
+        up, down = self.ema_up.value, self.ema_down.value
+        if up is None or down is None or (up == 0 and down == 0):
+            return math.nan
+        if down == 0:
+            return 100.0
+        return 100 - 100 / (1 + up / down)
+
+    @property
+    def macd_hist(self) -> float:
+        if self.ema_signal.value is None:
+            return math.nan
+        return (self.ema_fast.value - self.ema_slow.value) - self.ema_signal.value
+
+    @property
+    def ma(self) -> float:
+        if len(self.window) < self.window.maxlen:
+            return math.nan
+        return self.window_sum / len(self.window)
+
+    @property
+    def vwap(self) -> float:
+        return self.pv / self.volume if self.volume else math.nan
+
+
+__all__ = ["EMA", "IndicatorState", "ema", "ma", "rsi", "macd", "vwap"]
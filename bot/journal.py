@@ -0,0 +1,260 @@
+"""Append-only SQLite journal of trades and strategy decisions.
+
+Callers only enqueue rows; a background thread writes them in batched
+transactions to a WAL-mode database, so journaling never blocks the event
+loop.  Readers open their own connections and may query while the bot runs.
+"""
+from __future__ import annotations
+
+import csv
+import queue
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, time as dtime, timezone
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .logger import logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    symbol TEXT NOT NULL,
+    side TEXT NOT NULL,
+    qty REAL NOT NULL,
+    price REAL NOT NULL,
+    fee REAL NOT NULL,
+    pnl REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trades_symbol_ts ON trades (symbol, ts);
+CREATE INDEX IF NOT EXISTS trades_ts ON trades (ts);
+CREATE TABLE IF NOT EXISTS decisions (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    symbol TEXT NOT NULL,
+    action TEXT NOT NULL,
+    reason TEXT NOT NULL,
+    grade TEXT NOT NULL,
+    score REAL NOT NULL,
+    price REAL NOT NULL,
+    qty REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS decisions_symbol_ts ON decisions (symbol, ts);
+CREATE INDEX IF NOT EXISTS decisions_ts ON decisions (ts);
+"""
+
+_INSERT = {
+    "trades": "INSERT INTO trades (ts, symbol, side, qty, price, fee, pnl) VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "decisions": (
+        "INSERT INTO decisions (ts, symbol, action, reason, grade, score, price, qty)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+}
+
+_STOP = object()
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open ``path`` in WAL mode with the journal schema."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # WAL keeps the database consistent on power loss at NORMAL; only the
+    # last few batches can be lost
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class Journal:
+    """Queue trade and decision rows for a background SQLite writer.
+
+    Rows are committed every ``batch_size`` rows or ``flush_sec`` seconds,
+    whichever comes first.  If the writer falls ``max_queue`` rows behind,
+    new rows are dropped and counted rather than blocking the caller.
+    """
+
+    def __init__(self, path: str, batch_size: int = 500, flush_sec: float = 0.5, max_queue: int = 100_000):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_sec = flush_sec
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(max_queue)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "Journal":
+        connect(self.path).close()  # fail fast on a bad path
+        self._thread = threading.Thread(target=self._run, name="journal", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Write everything queued so far and stop the writer."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        if self.dropped:
+            logger.warning(f"[JOURNAL] dropped {self.dropped} rows: writer fell behind")
+
+    def __enter__(self) -> "Journal":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # --- producers -------------------------------------------------------
+
+    def _put(self, table: str, row: tuple) -> None:
+        try:
+            self._queue.put_nowait((table, row))
+        except queue.Full:
+            self.dropped += 1
+
+    def trade(
+        self, symbol: str, side: str, qty: float, price: float, fee: float, pnl: float = 0.0, ts: float | None = None
+    ) -> None:
+        self._put("trades", (time.time() if ts is None else ts, symbol, side, qty, price, fee, pnl))
+
+    def decision(
+        self,
+        symbol: str,
+        action: str,
+        price: float,
+        qty: float = 0.0,
+        reason: str = "",
+        grade: str = "",
+        score: float = 0.0,
+        ts: float | None = None,
+    ) -> None:
+        """Record a BUY, SELL or SKIP decision; ``reason`` says why for skips."""
+        self._put("decisions", (time.time() if ts is None else ts, symbol, action, reason, grade, score, price, qty))
+
+    # --- writer ----------------------------------------------------------
+
+    def _run(self) -> None:
+        conn = connect(self.path)
+        try:
+            stopping = False
+            while not stopping:
+                item = self._queue.get()
+                batch = []
+                deadline = time.monotonic() + self.flush_sec
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                self._write(conn, batch)
+        finally:
+            conn.close()
+
+    def _write(self, conn: sqlite3.Connection, batch: list) -> None:
+        if not batch:
+            return
+        rows = {"trades": [], "decisions": []}
+        for table, row in batch:
+            rows[table].append(row)
+        try:
+            with conn:
+                for table, values in rows.items():
+                    if values:
+                        conn.executemany(_INSERT[table], values)
+        except sqlite3.Error as exc:
+            logger.error(f"[JOURNAL] write of {len(batch)} rows failed: {exc}")
+
+
+# --- queries -------------------------------------------------------------
+
+
+def _day_bounds(day: date) -> Tuple[float, float]:
+    start = datetime.combine(day, dtime.min, timezone.utc).timestamp()
+    return start, start + 86400
+
+
+def day_risk(path: str, day: date | None = None) -> Tuple[float, float]:
+    """``(day_pnl, max_drawdown)`` for a UTC day, as :class:`RiskManager` tracks them."""
+    start, end = _day_bounds(day or datetime.now(timezone.utc).date())
+    conn = connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT pnl FROM trades WHERE ts >= ? AND ts < ? ORDER BY ts, id", (start, end)
+        ).fetchall()
+    finally:
+        conn.close()
+    day_pnl = max_drawdown = 0.0
+    for (pnl,) in rows:
+        day_pnl += pnl
+        max_drawdown = min(max_drawdown, day_pnl)
+    return day_pnl, max_drawdown
+
+
+def summary(path: str, since: float = 0.0, symbol: str | None = None) -> dict:
+    """Trade statistics in the shape of :meth:`Portfolio.summary`, plus skip counts."""
+    where, args = "ts >= ?", [since]
+    if symbol is not None:
+        where, args = where + " AND symbol = ?", args + [symbol]
+    conn = connect(path)
+    try:
+        trades, realized, wins = conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(pnl), 0), COALESCE(SUM(pnl > 0), 0) FROM trades WHERE {where}", args
+        ).fetchone()
+        skips = dict(
+            conn.execute(
+                f"SELECT reason, COUNT(*) FROM decisions WHERE action = 'SKIP' AND {where} GROUP BY reason", args
+            ).fetchall()
+        )
+    finally:
+        conn.close()
+    return {
+        "trades": trades,
+        "realized": realized,
+        "win_rate": wins / trades if trades else 0,
+        "wins": wins,
+        "losses": trades - wins,
+        "skips": skips,
+    }
+
+
+def export_csv(path: str, out: str, since: float = 0.0) -> int:
+    """Write trades since ``since`` to ``out`` in the ``Portfolio.export_csv`` layout."""
+    conn = connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT ts, symbol, side, qty, price, fee, pnl FROM trades WHERE ts >= ? ORDER BY ts, id", (since,)
+        ).fetchall()
+    finally:
+        conn.close()
+    with open(out, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["ts", "symbol", "side", "qty", "price", "fee", "pnl"])
+        for ts, *rest in rows:
+            writer.writerow([datetime.fromtimestamp(ts, timezone.utc).isoformat(), *rest])
+    return len(rows)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    p = argparse.ArgumentParser(prog="python -m bot.journal")
+    p.add_argument("path")
+    p.add_argument("--since", type=date.fromisoformat, default=None, help="UTC date, e.g. 2024-01-31")
+    p.add_argument("--symbol", default=None)
+    p.add_argument("--csv", default=None, help="also export trades to this CSV file")
+    args = p.parse_args()
+    since = _day_bounds(args.since)[0] if args.since else 0.0
+    print(summary(args.path, since, args.symbol))
+    if args.csv:
+        print(f"[EXPORT] {export_csv(args.path, args.csv, since)} trades -> {args.csv}")
+
+
+__all__ = ["Journal", "connect", "day_risk", "export_csv", "summary"]
@@ -0,0 +1,263 @@
+"""Local bookTicker websocket load generator and pipeline benchmark.
+
+``serve`` speaks the Binance combined-stream format
+(``{"stream": "btcusdt@bookTicker", "data": {...}}``) so
+:func:`subscribe_book_ticker` and ``bot.main`` can be pointed at it with
+``BINANCE_WS=ws://127.0.0.1:8765/stream``.  Quotes are random walks or
+replayed tick files, paced at a target rate with an optional burst profile.
+Every message carries an ``E`` event time (ms) so consumers can measure lag.
+
+``bench`` subscribes to such a feed, runs every tick through
+:class:`FabioStrategy` and reports throughput and decision lag.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import websockets
+
+from .config import Config
+from .executor import Executor
+from .logger import get_logger
+from .risk import RiskManager
+from .strategy import FabioStrategy
+from .streams import subscribe_book_ticker
+from .symbols import SymbolCache, SymbolFilters
+
+Quote = Tuple[str, float, float]
+
+# pacing granularity; each slot sends rate * SLOT_SEC messages
+SLOT_SEC = 0.01
+
+
+@dataclass
+class BurstProfile:
+    """Multiply the base rate by ``factor`` for ``length`` seconds every ``every`` seconds."""
+
+    factor: float = 1.0
+    every: float = 0.0
+    length: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "BurstProfile":
+        """``steady`` or ``FACTORx:LENGTH/EVERY`` (e.g. ``5x:1/10``)."""
+        if spec == "steady":
+            return cls()
+        factor, _, window = spec.partition("x:")
+        length, _, every = window.partition("/")
+        return cls(float(factor), float(every), float(length))
+
+    def rate(self, base: float, elapsed: float) -> float:
+        if self.every and elapsed % self.every < self.length:
+            return base * self.factor
+        return base
+
+
+def synthetic_symbols(n: int) -> List[str]:
+    return [f"SYM{i:03d}USDT" for i in range(n)]
+
+
+def random_walk(symbols: List[str], seed: int = 0, vol_bps: float = 2.0) -> Iterator[Quote]:
+    """Round-robin random-walk quotes with a one-tick spread."""
+    rng = random.Random(seed)
+    mids = {s: 100.0 * (1 + i) for i, s in enumerate(symbols)}
+    while True:
+        for s in symbols:
+            mids[s] *= 1 + rng.gauss(0, vol_bps / 10000)
+            yield s, round(mids[s] - 0.01, 2), round(mids[s] + 0.01, 2)
+
+
+def replay(files: Dict[str, str]) -> Iterator[Quote]:
+    """Replay recorded tick files (see :func:`bot.backtest.merge_ticks`) in a loop."""
+    from .backtest import merge_ticks
+
+    while True:
+        for tick in merge_ticks(files):
+            yield tick.symbol, tick.bid, tick.ask
+
+
+def _requested(path: str, served: List[str]) -> List[str]:
+    """Served symbols named in the ``streams=`` query; all of them if absent."""
+    streams = parse_qs(urlsplit(path).query).get("streams")
+    if not streams:
+        return list(served)
+    wanted = {name.split("@")[0].upper() for name in streams[0].split("/")}
+    return [s for s in served if s in wanted]
+
+
+def _message(update_id: int, symbol: str, bid: float, ask: float) -> str:
+    return json.dumps({
+        "stream": f"{symbol.lower()}@bookTicker",
+        "data": {
+            "u": update_id, "s": symbol, "b": f"{bid}", "B": "1.0", "a": f"{ask}", "A": "1.0",
+            "E": round(time.time() * 1000, 3),
+        },
+    })
+
+
+async def _pump(ws, quotes: Iterator[Quote], rate: float, profile: BurstProfile, duration: float, stats: dict) -> None:
+    start = time.perf_counter()
+    owed = 0.0
+    update_id = 0
+    while True:
+        elapsed = time.perf_counter() - start
+        if duration and elapsed >= duration:
+            break
+        owed += profile.rate(rate, elapsed) * SLOT_SEC
+        while owed >= 1:
+            symbol, bid, ask = next(quotes)
+            update_id += 1
+            await ws.send(_message(update_id, symbol, bid, ask))
+            stats["sent"] += 1
+            owed -= 1
+        await asyncio.sleep(max(0.0, start + elapsed + SLOT_SEC - time.perf_counter()))
+    await ws.close()
+
+
+async def serve(
+    host: str,
+    port: int,
+    symbols: List[str],
+    quotes_factory: Callable[[List[str]], Iterator[Quote]],
+    rate: float,
+    profile: BurstProfile,
+    duration: float = 0.0,
+    ready: Optional[asyncio.Future] = None,
+) -> dict:
+    """Serve the feed until every client has had ``duration`` seconds (0 = forever).
+
+    Each client gets ``quotes_factory(requested)``, quotes for the subset of
+    ``symbols`` it subscribed to.  Clients requesting none of them are refused.
+    """
+    stats = {"sent": 0, "clients": 0, "refused": 0}
+    started = time.perf_counter()
+
+    active = 0
+
+    async def handler(ws):
+        nonlocal active
+        requested = _requested(ws.request.path, symbols)
+        if not requested:
+            stats["refused"] += 1
+            await ws.close(1008, "none of the requested streams are served")
+            return
+        stats["clients"] += 1
+        active += 1
+        try:
+            await _pump(ws, quotes_factory(requested), rate, profile, duration, stats)
+        except websockets.ConnectionClosed:
+            pass  # client went away
+        finally:
+            active -= 1
+
+    async with websockets.serve(handler, host, port, max_queue=None) as server:
+        if ready is not None:
+            ready.set_result(server.sockets[0].getsockname()[1])
+        if duration:
+            await asyncio.sleep(duration)
+            # let late clients get their full duration before shutting down
+            while active or (stats["clients"] == 0 and time.perf_counter() - started < duration * 2):
+                await asyncio.sleep(SLOT_SEC)
+        else:
+            await asyncio.Future()
+    elapsed = time.perf_counter() - started
+    stats["rate"] = stats["sent"] / elapsed if elapsed else 0.0
+    return stats
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def bench(url: str, symbols: List[str], duration: float) -> dict:
+    """Consume ``url`` through the strategy for ``duration`` seconds and report."""
+    cfg = Config(WATCHLIST=symbols)
+    get_logger(cfg)
+    filters = SymbolCache({s: SymbolFilters(0.01, 0.000001, 0.000001, 5.0) for s in symbols})
+    strategy = FabioStrategy(cfg, filters, Executor(filters, cfg), RiskManager(cfg))
+    lags: List[float] = []
+    received = 0
+    start = time.perf_counter()
+
+    async def consume() -> None:
+        nonlocal received
+        async for msg in subscribe_book_ticker(symbols, url):
+            data = msg["data"]
+            strategy.on_tick(data["s"], float(data["b"]), float(data["a"]))
+            lags.append(time.time() * 1000 - data["E"])
+            received += 1
+
+    try:
+        await asyncio.wait_for(consume(), duration)
+    except asyncio.TimeoutError:
+        pass
+    elapsed = time.perf_counter() - start
+    return {
+        "received": received,
+        "rate": received / elapsed if elapsed else 0.0,
+        "lag_p50_ms": _percentile(lags, 0.5),
+        "lag_p99_ms": _percentile(lags, 0.99),
+        "lag_max_ms": max(lags, default=0.0),
+        "open_positions": len(strategy.positions),
+    }
+
+
+def _report(title: str, stats: dict) -> None:
+    print(f"[{title}] " + " ".join(f"{k}={v:.2f}" if isinstance(v, float) else f"{k}={v}" for k, v in stats.items()))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(prog="python -m bot.loadgen")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    s = sub.add_parser("serve", help="serve a synthetic or replayed bookTicker feed")
+    s.add_argument("--host", default="127.0.0.1")
+    s.add_argument("--port", type=int, default=8765)
+    s.add_argument("--symbols", default="10", help="count of synthetic symbols or comma separated names")
+    s.add_argument("--replay", nargs="*", default=None, metavar="SYMBOL=PATH")
+    s.add_argument("--rate", type=float, default=1000.0, help="messages per second per client")
+    s.add_argument("--profile", default="steady", help="steady or FACTORx:LENGTH/EVERY, e.g. 5x:1/10")
+    s.add_argument("--duration", type=float, default=0.0)
+    s.add_argument("--seed", type=int, default=0)
+    b = sub.add_parser("bench", help="run the strategy over a feed and report lag")
+    b.add_argument("--url", default="ws://127.0.0.1:8765/stream")
+    b.add_argument("--symbols", default="10")
+    b.add_argument("--duration", type=float, default=10.0)
+    return p.parse_args(argv)
+
+
+def _symbols(spec: str) -> List[str]:
+    return synthetic_symbols(int(spec)) if spec.isdigit() else [s.strip().upper() for s in spec.split(",")]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.cmd == "bench":
+        _report("BENCH", asyncio.run(bench(args.url, _symbols(args.symbols), args.duration)))
+        return
+    if args.replay:
+        files = {s.upper(): path for s, path in (arg.split("=", 1) for arg in args.replay)}
+        symbols = list(files)
+        factory = lambda wanted: replay({s: files[s] for s in wanted})  # noqa: E731
+    else:
+        symbols = _symbols(args.symbols)
+        factory = lambda wanted: random_walk(wanted, args.seed)  # noqa: E731
+    profile = BurstProfile.parse(args.profile)
+    stats = asyncio.run(serve(args.host, args.port, symbols, factory, args.rate, profile, args.duration))
+    _report("LOADGEN", stats)
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ["BurstProfile", "bench", "random_walk", "replay", "serve", "synthetic_symbols"]
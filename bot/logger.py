@@ -8,6 +8,7 @@ from .config import Config
 
 
 def get_logger(config: Config):
+    """Configure console and daily file sinks; call once per process."""
     logger.remove()
     level = "DEBUG" if config.DEBUG else "INFO"
     logger.add(lambda msg: print(msg, end=""), level=level)
@@ -18,4 +19,4 @@ def get_logger(config: Config):
     return logger
 
 
-__all__ = ["get_logger"]
+__all__ = ["get_logger", "logger"]
@@ -3,35 +3,47 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import json
 import signal
+import time
+from typing import Callable, Dict
 
-from binance.client import Client
-
+from . import checkpoint
+from .account import AccountState
 from .config import load_config, Config
-from .symbols import fetch_symbol_filters, SymbolCache
+from .rest import RestScheduler
+from .symbols import parse_symbol_filters, SymbolCache
 from .executor import Executor
+from .host import StrategyHost
+from .journal import Journal, day_risk
+from .logger import get_logger, logger
+from .metrics import METRICS, serve_metrics
 from .risk import RiskManager
 from .strategy import FabioStrategy
-from .streams import subscribe_book_ticker
+from .streams import subscribe_book_ticker, subscribe_user_data
 
 
-async def run(cfg: Config) -> None:
-    client = Client(cfg.BINANCE_API_KEY, cfg.BINANCE_API_SECRET)
-    filters = SymbolCache(fetch_symbol_filters(client, cfg.WATCHLIST))
-    executor = Executor(client, filters, cfg)
-    risk = RiskManager(cfg)
-    strategy = FabioStrategy(cfg, filters, executor, risk)
+async def _start_rest(cfg: Config) -> tuple[RestScheduler, SymbolCache]:
+    # all REST traffic is scheduled against the exchange weight limits
+    rest = await RestScheduler(
+        cfg.BINANCE_REST, cfg.BINANCE_API_KEY, cfg.BINANCE_API_SECRET, cfg.REST_WEIGHT_LIMIT
+    ).start()
+    filters = SymbolCache(parse_symbol_filters(await rest.get_exchange_info(), cfg.WATCHLIST))
+    return rest, filters
+
 
-    async def consumer():
-        async for msg in subscribe_book_ticker(cfg.WATCHLIST):
-            data = msg.get("data", {})
-            symbol = data.get("s")
-            bid = float(data.get("b", 0))
-            ask = float(data.get("a", 0))
-            strategy.on_tick(symbol, bid, ask)
+async def consume_book_ticker(cfg: Config, on_tick: Callable[[str, float, float], object]) -> None:
+    """Feed watchlist bookTicker updates to ``on_tick``, recording tick metrics."""
+    async for msg in subscribe_book_ticker(cfg.WATCHLIST, cfg.BINANCE_WS):
+        data = msg.get("data", {})
+        symbol = data.get("s")
+        METRICS.ticks[symbol] += 1
+        if "E" in data:  # event time, present on load-generator feeds
+            METRICS.observe_tick_lag(time.time() - data["E"] / 1000)
+        on_tick(symbol, float(data.get("b", 0)), float(data.get("a", 0)))
 
-    task = asyncio.create_task(consumer())
 
+async def _wait_for_signal() -> None:
     stop_event = asyncio.Event()
 
     def _stop(*_: object) -> None:
@@ -39,13 +51,100 @@ async def run(cfg: Config) -> None:
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         asyncio.get_running_loop().add_signal_handler(sig, _stop)
-
     await stop_event.wait()
-    task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+
+
+async def _stop_tasks(*tasks: asyncio.Task | None) -> None:
+    """Cancel and await ``tasks``; a task that already died is logged, not raised,
+    so teardown still saves state."""
+    for t in tasks:
+        if t is None:
+            continue
+        t.cancel()
+        try:
+            await t
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception(f"[SHUTDOWN] task {t.get_name()} had failed")
+
+
+async def _serve_until_signal(
+    cfg: Config,
+    rest: RestScheduler,
+    tasks: list[asyncio.Task | None],
+    positions=None,
+    risk: RiskManager | None = None,
+) -> None:
+    """Expose metrics until SIGINT/SIGTERM, then stop ``tasks`` and close ``rest``."""
+    server = None
+    if cfg.METRICS_PORT:
+        server = await serve_metrics(cfg.METRICS_HOST, cfg.METRICS_PORT, positions, risk)
+    await _wait_for_signal()
+    await _stop_tasks(*tasks)
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+    await rest.close()
+
+
+async def run_variants(cfg: Config, variants: Dict[str, dict]) -> None:
+    """Paper-trade several config variants over one shared feed."""
+    if cfg.LIVE:
+        raise ValueError("strategy variants are paper-trading only")
+    get_logger(cfg)
+    rest, filters = await _start_rest(cfg)
+    host = StrategyHost(cfg, filters, variants, rest)
+
+    task = asyncio.create_task(consume_book_ticker(cfg, host.on_tick))
+    await _serve_until_signal(cfg, rest, [task])
+    for name, summary in host.summary().items():
+        logger.info(f"[VARIANT] {name} " + " ".join(f"{k}={v}" for k, v in summary.items()))
+
+
+def _restore(cfg: Config, strategy: FabioStrategy) -> None:
+    """Warm-start ``strategy`` from the checkpoint, else today's journaled PnL."""
+    risk = strategy.risk
+    state = checkpoint.load(cfg.CHECKPOINT_PATH)
+    if state is not None:
+        checkpoint.restore(strategy, state)
+        strategy.logger.info(
+            f"[RESTORE] {cfg.CHECKPOINT_PATH} positions={len(strategy.positions)} "
+            f"day_pnl={risk.day_pnl:.2f}"
+        )
+    elif cfg.JOURNAL_PATH:
+        # without a checkpoint, today's realised PnL still counts towards the daily drawdown limit
+        risk.day_pnl, risk.max_drawdown = day_risk(cfg.JOURNAL_PATH)
+        risk.update_pnl(0.0)  # re-applies the drawdown limit
+        strategy.logger.info(f"[RESTORE] {cfg.JOURNAL_PATH} day_pnl={risk.day_pnl:.2f}")
+
+
+async def run(cfg: Config) -> None:
+    get_logger(cfg)
+    rest, filters = await _start_rest(cfg)
+    account = AccountState() if cfg.LIVE else None
+    executor = Executor(filters, cfg, account, rest)
+    risk = RiskManager(cfg)
+    journal = Journal(cfg.JOURNAL_PATH).start() if cfg.JOURNAL_PATH else None
+    strategy = FabioStrategy(cfg, filters, executor, risk, journal)
+    _restore(cfg, strategy)
+
+    async def account_consumer():
+        async for event in subscribe_user_data(rest, cfg.BINANCE_WS_USER):
+            account.apply(event)
+
+    tasks = [asyncio.create_task(consume_book_ticker(cfg, strategy.on_tick))]
+    if account is not None:
+        tasks.append(asyncio.create_task(account_consumer()))
+    if cfg.CHECKPOINT_SEC > 0:
+        tasks.append(
+            asyncio.create_task(checkpoint.checkpoint_loop(strategy, cfg.CHECKPOINT_PATH, cfg.CHECKPOINT_SEC))
+        )
+
+    await _serve_until_signal(cfg, rest, tasks, strategy.positions, risk)
+    checkpoint.save(cfg.CHECKPOINT_PATH, checkpoint.snapshot(strategy))
+    if journal is not None:
+        journal.close()
 
 
 def parse_args() -> argparse.Namespace:
@@ -54,6 +153,7 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--debug", type=str, default=None)
     p.add_argument("--trades-only", type=str, default=None)
     p.add_argument("--watchlist", type=str, default=None)
+    p.add_argument("--variants", type=str, default=None, help="JSON file of name -> Config overrides")
     return p.parse_args()
 
 
@@ -69,11 +169,17 @@ def apply_overrides(cfg: Config, args: argparse.Namespace) -> Config:
     return cfg
 
 
+def load_variants(path: str) -> Dict[str, dict]:
+    with open(path) as f:
+        return json.load(f)
+
+
 def main() -> None:
     cfg = load_config()
     args = parse_args()
     cfg = apply_overrides(cfg, args)
-    asyncio.run(run(cfg))
+    variants = load_variants(args.variants) if args.variants else None
+    asyncio.run(run_variants(cfg, variants) if variants else run(cfg))
 
 
 if __name__ == "__main__":
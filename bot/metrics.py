@@ -0,0 +1,122 @@
+"""Process-local counters and a Prometheus text endpoint.
+
+Counters are plain ints mutated on the event loop thread, so increments are
+lock-free and a scrape only reads them.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import resource
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .risk import RiskManager
+
+if TYPE_CHECKING:
+    from .book import PositionBook
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.ticks: Dict[str, int] = defaultdict(int)
+        self.skips: Dict[str, int] = defaultdict(int)
+        self.orders: Dict[tuple[str, str], int] = defaultdict(int)
+        self.order_latency_sum = 0.0
+        self.order_latency_count = 0
+        self.ws_reconnects = 0
+        self.tick_lag_sum = 0.0
+        self.tick_lag_count = 0
+
+    def observe_order(self, side: str, mode: str, latency: float | None = None) -> None:
+        self.orders[(side, mode)] += 1
+        if latency is not None:
+            self.order_latency_sum += latency
+            self.order_latency_count += 1
+
+    def observe_tick_lag(self, lag: float) -> None:
+        self.tick_lag_sum += lag
+        self.tick_lag_count += 1
+
+
+METRICS = Metrics()
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is peak rather than current RSS, in KiB on Linux.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def render(
+    metrics: Metrics = METRICS,
+    positions: Optional[PositionBook] = None,
+    risk: Optional[RiskManager] = None,
+) -> str:
+    """Return ``metrics`` and live strategy gauges in Prometheus text format."""
+    lines = [
+        "# TYPE bot_ticks_total counter",
+        *(f'bot_ticks_total{{symbol="{s}"}} {n}' for s, n in sorted(metrics.ticks.items())),
+        "# TYPE bot_ws_reconnects_total counter",
+        f"bot_ws_reconnects_total {metrics.ws_reconnects}",
+        "# TYPE bot_skips_total counter",
+        *(f'bot_skips_total{{reason="{r}"}} {n}' for r, n in sorted(metrics.skips.items())),
+        "# TYPE bot_orders_total counter",
+        *(
+            f'bot_orders_total{{side="{side}",mode="{mode}"}} {n}'
+            for (side, mode), n in sorted(metrics.orders.items())
+        ),
+        "# TYPE bot_order_latency_seconds summary",
+        f"bot_order_latency_seconds_sum {metrics.order_latency_sum}",
+        f"bot_order_latency_seconds_count {metrics.order_latency_count}",
+        "# TYPE bot_tick_lag_seconds summary",
+        f"bot_tick_lag_seconds_sum {metrics.tick_lag_sum}",
+        f"bot_tick_lag_seconds_count {metrics.tick_lag_count}",
+    ]
+    if positions is not None:
+        lines += ["# TYPE bot_open_positions gauge", f"bot_open_positions {len(positions)}"]
+    if risk is not None:
+        lines += [
+            "# TYPE bot_day_pnl_usdt gauge",
+            f"bot_day_pnl_usdt {risk.day_pnl}",
+            "# TYPE bot_max_drawdown_usdt gauge",
+            f"bot_max_drawdown_usdt {risk.max_drawdown}",
+        ]
+    lines += ["# TYPE process_resident_memory_bytes gauge", f"process_resident_memory_bytes {_rss_bytes()}"]
+    return "\n".join(lines) + "\n"
+
+
+async def serve_metrics(
+    host: str,
+    port: int,
+    positions: Optional[PositionBook] = None,
+    risk: Optional[RiskManager] = None,
+) -> asyncio.AbstractServer:
+    """Serve ``GET /metrics`` on the running loop."""
+
+    async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request.split()
+            if len(parts) >= 2 and parts[0] == b"GET" and parts[1].split(b"?")[0] == b"/metrics":
+                status, body = "200 OK", render(METRICS, positions, risk).encode()
+            else:
+                status, body = "404 Not Found", b"not found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(_handle, host, port)
+
+
+__all__ = ["METRICS", "Metrics", "render", "serve_metrics"]
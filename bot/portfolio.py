@@ -24,10 +24,10 @@ class Trade:
 class Portfolio:
     trades: List[Trade] = field(default_factory=list)
 
-    def record(self, result: ExecutionResult, pnl: float = 0.0) -> None:
+    def record(self, result: ExecutionResult, pnl: float = 0.0, ts: datetime | None = None) -> None:
         self.trades.append(
             Trade(
-                ts=datetime.now(timezone.utc),
+                ts=ts or datetime.now(timezone.utc),
                 symbol=result.symbol,
                 side=result.side,
                 qty=result.qty,
@@ -0,0 +1,264 @@
+"""Request-weight-aware async REST scheduler for the Binance spot API.
+
+All calls are queued by priority and only dispatched while the minute
+request-weight budget (and, for orders, the 10s order-count budget) has
+room.  Budgets are tracked locally and resynchronised from the
+``X-MBX-USED-WEIGHT-1M`` / ``X-MBX-ORDER-COUNT-10S`` response headers.
+Informational calls may only use part of the weight budget so order
+placement and cancels always have headroom to exit positions.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+if TYPE_CHECKING:
+    import aiohttp
+
+BINANCE_REST = "https://api.binance.com"
+
+PRIORITY_ORDER = 0
+PRIORITY_INFO = 1
+
+
+class RestError(Exception):
+    def __init__(self, status: int, payload: Any):
+        super().__init__(f"HTTP {status}: {payload}")
+        self.status = status
+        self.payload = payload
+
+
+class WindowBudget:
+    """Usage counter for a fixed exchange window (e.g. each UTC minute)."""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.used = 0
+        self._start = 0.0
+
+    def _roll(self, now: float) -> None:
+        start = now - now % self.window
+        if start != self._start:
+            self._start = start
+            self.used = 0
+
+    def delay(self, cost: int, cap: float, now: float) -> float:
+        """Seconds until ``cost`` fits under ``cap * limit``; 0 if it fits now."""
+        self._roll(now)
+        if self.used + cost <= self.limit * cap:
+            return 0.0
+        return self._start + self.window - now
+
+    def reserve(self, cost: int, now: float) -> None:
+        self._roll(now)
+        self.used += cost
+
+    def sync(self, used: int, now: float) -> None:
+        self._roll(now)
+        self.used = max(self.used, used)
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    seq: int
+    method: str = field(compare=False)
+    path: str = field(compare=False)
+    params: Dict[str, Any] = field(compare=False)
+    weight: int = field(compare=False)
+    signed: bool = field(compare=False)
+    is_order: bool = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class RestScheduler:
+    def __init__(
+        self,
+        base_url: str = BINANCE_REST,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        weight_limit: int = 6000,
+        order_limit: int = 100,
+        info_headroom: float = 0.8,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.weights = WindowBudget(weight_limit, 60.0)
+        self.orders = WindowBudget(order_limit, 10.0)
+        self.info_headroom = info_headroom
+        self._heap: list[_Job] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self._paused_until = 0.0
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._sends: set[asyncio.Task] = set()
+
+    async def start(self) -> "RestScheduler":
+        import aiohttp
+
+        self._session = aiohttp.ClientSession()
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        return self
+
+    async def close(self) -> None:
+        """Stop dispatching; callers of still-queued requests get ``RuntimeError``."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, *self._sends, return_exceptions=True)
+        for job in self._heap:
+            if not job.future.done():
+                job.future.set_exception(RuntimeError("RestScheduler closed before the request was sent"))
+        self._heap.clear()
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self) -> "RestScheduler":
+        return await self.start()
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    # --- queueing --------------------------------------------------------
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        weight: int = 1,
+        signed: bool = False,
+        priority: int = PRIORITY_INFO,
+        is_order: bool = False,
+    ) -> Any:
+        """Queue a request and return its decoded JSON body.
+
+        Identical unsigned GETs already queued or in flight share one call.
+        """
+        params = dict(params or {})
+        key = None
+        if method == "GET" and not signed:
+            key = (path, tuple(sorted(params.items())))
+            pending = self._inflight.get(key)
+            if pending is not None:
+                return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        if key is not None:
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        job = _Job(priority, next(self._seq), method, path, params, weight, signed, is_order, future)
+        heapq.heappush(self._heap, job)
+        self._wakeup.set()
+        return await asyncio.shield(future)
+
+    async def _dispatch(self) -> None:
+        while True:
+            if not self._heap:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            job = self._heap[0]
+            now = time.time()
+            cap = 1.0 if job.priority == PRIORITY_ORDER else self.info_headroom
+            delay = max(self._paused_until - now, self.weights.delay(job.weight, cap, now))
+            if job.is_order:
+                delay = max(delay, self.orders.delay(1, 1.0, now))
+            if delay > 0:
+                # a higher-priority job arriving meanwhile is re-evaluated first
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+            heapq.heappop(self._heap)
+            self.weights.reserve(job.weight, now)
+            if job.is_order:
+                self.orders.reserve(1, now)
+            task = asyncio.create_task(self._send(job))
+            self._sends.add(task)
+            task.add_done_callback(self._sends.discard)
+
+    # --- transport -------------------------------------------------------
+
+    def _sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        params = {**params, "timestamp": int(time.time() * 1000)}
+        query = urlencode(params)
+        params["signature"] = hmac.new(
+            (self.api_secret or "").encode(), query.encode(), hashlib.sha256
+        ).hexdigest()
+        return params
+
+    async def _send(self, job: _Job) -> None:
+        params = self._sign(job.params) if job.signed else job.params
+        url = self.base_url + job.path
+        if params:
+            # encode ourselves so the signed query is exactly what is sent
+            url += "?" + urlencode(params)
+        headers = {"X-MBX-APIKEY": self.api_key} if self.api_key else {}
+        try:
+            async with self._session.request(job.method, url, headers=headers) as resp:
+                self._track(resp)
+                payload = await resp.json(content_type=None)
+                if resp.status >= 400:
+                    raise RestError(resp.status, payload)
+        except BaseException as exc:
+            if not job.future.done():
+                job.future.set_exception(exc)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            return
+        if not job.future.done():
+            job.future.set_result(payload)
+
+    def _track(self, resp: "aiohttp.ClientResponse") -> None:
+        now = time.time()
+        used = resp.headers.get("X-MBX-USED-WEIGHT-1M")
+        if used is not None:
+            self.weights.sync(int(used), now)
+        orders = resp.headers.get("X-MBX-ORDER-COUNT-10S")
+        if orders is not None:
+            self.orders.sync(int(orders), now)
+        if resp.status in (418, 429):
+            retry_after = float(resp.headers.get("Retry-After", 60))
+            self._paused_until = max(self._paused_until, now + retry_after)
+
+    # --- endpoints -------------------------------------------------------
+
+    async def get_exchange_info(self) -> dict:
+        return await self.request("GET", "/api/v3/exchangeInfo", weight=20)
+
+    async def get_symbol_ticker(self, symbol: str) -> dict:
+        return await self.request("GET", "/api/v3/ticker/price", {"symbol": symbol}, weight=2)
+
+    async def create_order(self, **params: Any) -> dict:
+        return await self.request(
+            "POST", "/api/v3/order", params, weight=1, signed=True, priority=PRIORITY_ORDER, is_order=True
+        )
+
+    async def cancel_order(self, **params: Any) -> dict:
+        return await self.request(
+            "DELETE", "/api/v3/order", params, weight=1, signed=True, priority=PRIORITY_ORDER
+        )
+
+    async def stream_get_listen_key(self) -> str:
+        res = await self.request("POST", "/api/v3/userDataStream", weight=2)
+        return res["listenKey"]
+
+    async def stream_keepalive(self, listen_key: str) -> dict:
+        return await self.request("PUT", "/api/v3/userDataStream", {"listenKey": listen_key}, weight=2)
+
+
+__all__ = ["PRIORITY_INFO", "PRIORITY_ORDER", "RestError", "RestScheduler", "WindowBudget"]
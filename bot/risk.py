@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
+from typing import Callable
 
 from .config import Config
 
@@ -15,11 +16,19 @@ class Position:
     stop: float
     take_profit: float
     qty: float
+    pid: int = 0
 
 
 class RiskManager:
-    def __init__(self, config: Config):
+    """Daily drawdown limit and post-exit cooldown shared by every symbol.
+
+    ``clock`` returns the current time in seconds; backtests pass one driven
+    by tick timestamps so cooldowns are measured in replayed time.
+    """
+
+    def __init__(self, config: Config, clock: Callable[[], float] = time.time):
         self.config = config
+        self.clock = clock
         self.day_pnl = 0.0
         self.max_drawdown = 0.0
         self.cooldown_until = 0.0
@@ -27,20 +36,27 @@ class RiskManager:
     def update_pnl(self, pnl: float) -> None:
         self.day_pnl += pnl
         self.max_drawdown = min(self.max_drawdown, self.day_pnl)
-        if self.day_pnl - self.max_drawdown <= -self.config.DAILY_MAX_DD_USDT:
+        # the day's low, not the distance from it, trips the limit
+        if self.max_drawdown <= -self.config.DAILY_MAX_DD_USDT:
             self.cooldown_until = float("inf")
 
     def can_trade(self) -> bool:
-        return time.time() >= self.cooldown_until
+        return self.clock() >= self.cooldown_until
 
     def start_cooldown(self) -> None:
-        self.cooldown_until = time.time() + self.config.COOLDOWN_SEC
+        # never shortens a longer stop, e.g. the drawdown limit's
+        self.cooldown_until = max(self.cooldown_until, self.clock() + self.config.COOLDOWN_SEC)
 
-    def trailing_stop(self, position: Position, current_price: float) -> float:
+    def trailing_stop(self, position: Position, current_price: float, book=None) -> float:
+        """Ratchet ``position.stop`` up; re-index it in ``book`` if given."""
         bps_gain = (current_price - position.entry_price) / position.entry_price * 10000
         if bps_gain > self.config.TRAIL_START_BPS:
             trail_price = current_price * (1 - self.config.TRAIL_STEP_BPS / 10000)
-            position.stop = max(position.stop, trail_price)
+            if trail_price > position.stop:
+                if book is not None:
+                    book.move_stop(position, trail_price)
+                else:
+                    position.stop = trail_price
         return position.stop
 
 
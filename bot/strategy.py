@@ -1,11 +1,10 @@
 """Fabio entry/exit logic."""
 from __future__ import annotations
 
-import pandas as pd
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from .config import Config
-from .indicators import ema, ma, rsi, macd, vwap
+from .indicators import IndicatorState
 from .scoring import fabio_score, format_fallback, ScoreResult
 from time import time
 
@@ -16,61 +15,95 @@ from .executor import (
     size_position,
     notional_ok,
 )
-from .executor import Executor
+from .book import PositionBook
 from .risk import Position, RiskManager
 from .symbols import SymbolCache
-from .logger import get_logger
+from .logger import logger
+from .metrics import METRICS
+
+if TYPE_CHECKING:
+    from .journal import Journal
+
+# Ticks per symbol before the strategy starts deciding.
+WARMUP_TICKS = 30
+# Repeats of the same skip reason for a symbol are journaled at most this often.
+SKIP_JOURNAL_MS = 1000
+
+
+def score_tick(symbol: str, bid: float, ask: float, state: IndicatorState) -> ScoreResult:
+    """Fabio score for the latest tick folded into ``state``."""
+    mid = (bid + ask) / 2
+    vwap_val = state.vwap
+    return fabio_score(
+        symbol,
+        trend=mid > state.ma,
+        macd_hist=state.macd_hist,
+        rsi=state.rsi,
+        vwap_prox=abs(mid - vwap_val) / vwap_val,
+        spread=(ask - bid) / mid,
+        volume=1.0,
+    )
 
 
 class FabioStrategy:
-    def __init__(self, config: Config, symbols: SymbolCache, executor: Executor, risk: RiskManager):
+    def __init__(
+        self,
+        config: Config,
+        symbols: SymbolCache,
+        executor: Executor,
+        risk: RiskManager,
+        journal: Journal | None = None,
+    ):
         self.config = config
         self.symbols = symbols
         self.executor = executor
         self.risk = risk
-        self.logger = get_logger(config)
-        self.data: Dict[str, pd.DataFrame] = {s: pd.DataFrame(columns=["price", "volume"]) for s in config.WATCHLIST}
-        self.positions: Dict[str, Position] = {}
+        self.logger = logger
+        self.journal = journal
+        self.indicators: Dict[str, IndicatorState] = {s: IndicatorState() for s in config.WATCHLIST}
+        self.positions = PositionBook(config.MAX_OPEN_TRADES)
         self._decision_memo: Dict[str, tuple[float, str, float]] = {}
-
+        self._skip_memo: Dict[tuple[str, str], float] = {}
 
     def on_tick(self, symbol: str, bid: float, ask: float, volume: float = 0.0) -> Optional[Position]:
         mid = (bid + ask) / 2
-        df = self.data[symbol]
-        df.loc[pd.Timestamp.utcnow()] = {"price": mid, "volume": volume}
-        if len(df) < 30:
+        state = self.indicators[symbol]
+        state.update(mid, volume)
+        if state.count < WARMUP_TICKS:
             return None
+        score = score_tick(symbol, bid, ask, state)
+        return self.decide(symbol, bid, ask, state.macd_hist, score)
 
-        price_series = df["price"]
-        rsi_val = rsi(price_series).iloc[-1]
-        macd_line, signal_line, hist = macd(price_series)
-        hist_val = hist.iloc[-1]
-        trend = price_series.iloc[-1] > ma(price_series, 200).iloc[-1]
-        vwap_val = vwap(df).iloc[-1]
-        vwap_prox = abs(mid - vwap_val) / vwap_val
-        spread = (ask - bid) / mid
-
-        score = fabio_score(
-            symbol,
-            trend=trend,
-            macd_hist=hist_val,
-            rsi=rsi_val,
-            vwap_prox=vwap_prox,
-            spread=spread,
-            volume=1.0,
-        )
+    def decide(self, symbol: str, bid: float, ask: float, hist_val: float, score: ScoreResult) -> Optional[Position]:
+        """Exit, trail and entry logic for one tick given its indicator output.
 
+        Split from :meth:`on_tick` so backtests can feed precomputed features.
+        """
+        mid = (bid + ask) / 2
         if symbol in self.positions:
-            pos = self.positions[symbol]
-            # check exit conditions
-            if mid <= pos.stop or mid >= pos.take_profit or hist_val < 0:
-                pnl = (mid - pos.entry_price) * pos.qty - self.executor._calc_fee(mid * pos.qty)
+            # a negative MACD histogram exits the whole symbol, otherwise only
+            # positions whose stop/take-profit was crossed
+            exits = self.positions.for_symbol(symbol) if hist_val < 0 else self.positions.triggered(symbol, mid)
+            for pos in exits:
+                pnl = self.exit_pnl(pos, mid)
                 self.risk.update_pnl(pnl)
+                METRICS.observe_order("SELL", "sim")
                 self.logger.info(f"[SELL] {symbol} qty={pos.qty:.6f} px={mid:.2f} PnL={pnl:.2f}")
-                del self.positions[symbol]
+                if self.journal is not None:
+                    self.journal.decision(symbol, "SELL", mid, pos.qty)
+                    self.journal.trade(symbol, "SELL", pos.qty, mid, self.executor._calc_fee(mid * pos.qty), pnl)
+                self.positions.remove(pos)
+            if exits:
                 self.risk.start_cooldown()
-            else:
-                self.risk.trailing_stop(pos, mid)
+                return None
+            for pos in self.positions.in_profit(symbol, mid, self.config.TRAIL_START_BPS):
+                self.risk.trailing_stop(pos, mid, self.positions)
+            if not self._may_scale_in(symbol, mid):
+                return None
+
+        if not self.risk.can_trade():
+            self._skip(symbol, "cooldown", ask, score)
+            self.logger.debug(f"[SKIP] {symbol} reason=cooldown until={self.risk.cooldown_until:.0f}")
             return None
 
         grade_order = {"A": 3, "B": 2, "C": 1}
@@ -78,6 +111,7 @@ class FabioStrategy:
             grade_order.get(score.grade, 0) < grade_order.get(self.config.ENTRY_MIN_GRADE, 0)
             and score.score < self.config.ENTRY_MIN_SCORE
         ):
+            self._skip(symbol, "grade", ask, score)
             self.logger.info(
                 f"[SKIP] {symbol} reason=grade grade={score.grade} score={score.score:.2f}"
             )
@@ -91,6 +125,7 @@ class FabioStrategy:
             threshold = self.config.MIN_NOTIONAL_USDT
             if reason == "min_qty":
                 threshold = self.symbols.min_qty(symbol)
+            self._skip(symbol, reason, ask, score)
             self.logger.info(
                 f"[SKIP] {symbol} reason={reason} px={ask:.2f} qty={notional/ask:.6f} "
                 f"notional={notional:.2f} < {threshold:.2f}"
@@ -103,17 +138,28 @@ class FabioStrategy:
         if not notional_ok(symbol, ask, qty, self.symbols.filters, self.config):
             mn = self.symbols.min_notional(symbol)
             notional = ask * qty
+            self._skip(symbol, "min_notional", ask, score, qty)
             self.logger.info(
                 f"[SKIP] {symbol} reason=min_notional px={ask:.2f} qty={qty:.6f} notional={notional:.2f} < {mn:.2f}"
             )
             return None
 
+        # checked last so a max_open skip means an entry qualified otherwise
+        if self.positions.full:
+            self._skip(symbol, "max_open", ask, score, qty)
+            self.logger.debug(f"[SKIP] {symbol} reason=max_open open={len(self.positions)}")
+            return None
+
         pos = Position(symbol, "LONG", mid, stop, tp, qty)
-        self.positions[symbol] = pos
+        self.positions.add(pos)
         result = self.executor.simulate(symbol, "BUY", qty, ask)
+        METRICS.observe_order("BUY", "sim")
         self.logger.info(
             f"[BUY] {symbol} qty={qty:.6f} px={ask:.2f} notional={result.notional:.2f} fee={result.fee:.4f}"
         )
+        if self.journal is not None:
+            self.journal.decision(symbol, "BUY", ask, qty, grade=score.grade, score=score.score)
+            self.journal.trade(symbol, "BUY", result.qty, result.price, result.fee)
 
         risk_label = "risk_bps" if self.config.RISK_UNIT == "bps" else "risk_usdt"
         risk_val = (
@@ -129,6 +175,28 @@ class FabioStrategy:
             )
         return pos
 
+    def _may_scale_in(self, symbol: str, mid: float) -> bool:
+        """Add to a held symbol only up to the cap and after a rise past the last entry."""
+        if len(self.positions.for_symbol(symbol)) > self.config.MAX_SCALE_INS:
+            return False
+        last = self.positions.last_entry(symbol)
+        return mid >= last.entry_price * (1 + self.config.SCALE_IN_BPS / 10000)
+
+    def _skip(self, symbol: str, reason: str, px: float, score: ScoreResult, qty: float = 0.0) -> None:
+        """Count every skip; journal one per symbol and reason every ``SKIP_JOURNAL_MS``."""
+        METRICS.skips[reason] += 1
+        if self.journal is None:
+            return
+        now = time() * 1000
+        if now - self._skip_memo.get((symbol, reason), 0.0) < SKIP_JOURNAL_MS:
+            return
+        self._skip_memo[(symbol, reason)] = now
+        self.journal.decision(symbol, "SKIP", px, qty, reason, score.grade, score.score)
+
+    def exit_pnl(self, pos: Position, px: float) -> float:
+        """Net PnL of closing ``pos`` at ``px`` after taker fees."""
+        return (px - pos.entry_price) * pos.qty - self.executor._calc_fee(px * pos.qty)
+
     def _should_log(self, symbol: str, px: float, grade: str, every_ms: int = 200) -> bool:
         rounded = format_price(symbol, px, self.symbols.filters)
         last_px, last_grade, last_ts = self._decision_memo.get(symbol, (None, None, 0.0))
@@ -137,21 +205,6 @@ class FabioStrategy:
             return False
         self._decision_memo[symbol] = (rounded, grade, now)
         return True
-        if score.grade == "A" and self.risk.can_trade():
-            qty = self.config.MAX_CAPITAL_USDT / ask
-            qty = self.symbols.format_qty(symbol, qty)
-            stop = mid * (1 - self.config.STOP_LOSS_BPS / 10000)
-            tp = mid * (1 + self.config.PROFIT_TAKE_BPS / 10000)
-            pos = Position(symbol, "LONG", mid, stop, tp, qty)
-            self.positions[symbol] = pos
-            result = self.executor.simulate(symbol, "BUY", qty, ask)
-            self.logger.info(f"[BUY] {symbol} qty={qty:.6f} px={ask:.2f} notional={result.notional:.2f} fee={result.fee:.4f}")
-            self.logger.debug("[DECISION] " + format_fallback(score, mid, stop, qty, ""))
-            return pos
-
-        if self.config.DEBUG:
-            self.logger.debug("[DECISION] " + format_fallback(score, mid, mid * (1 - self.config.STOP_LOSS_BPS / 10000), 0.0, ""))
-        return None
-
-
-__all__ = ["FabioStrategy"]
+
+
+__all__ = ["FabioStrategy", "WARMUP_TICKS", "score_tick"]
@@ -1,28 +1,35 @@
-"""WebSocket stream management for Binance bookTicker."""
+"""WebSocket stream management for Binance bookTicker and user data."""
 from __future__ import annotations
 
 import asyncio
 import json
-from typing import AsyncIterator, Dict, List
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List
 
 import websockets
 from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 
-BINANCE_WS = "wss://stream.binance.com:9443/stream"
+from .logger import logger
+from .metrics import METRICS
+
+if TYPE_CHECKING:
+    from binance.client import Client
 
+    from .rest import RestScheduler
 
-class StreamError(Exception):
-    pass
+BINANCE_WS = "wss://stream.binance.com:9443/stream"
+BINANCE_WS_RAW = "wss://stream.binance.com:9443/ws"
+# Listen keys expire after 60 minutes without a keepalive.
+LISTEN_KEY_KEEPALIVE_SEC = 30 * 60
 
 
 async def _connect(url: str):
     return await websockets.connect(url, ping_interval=20, ping_timeout=20)
 
 
-async def subscribe_book_ticker(symbols: List[str]) -> AsyncIterator[Dict]:
-    """Yield bookTicker messages for symbols."""
+async def subscribe_book_ticker(symbols: List[str], url: str = BINANCE_WS) -> AsyncIterator[Dict]:
+    """Yield bookTicker messages for symbols from the combined stream at ``url``."""
     stream_names = "/".join(f"{s.lower()}@bookTicker" for s in symbols)
-    url = f"{BINANCE_WS}?streams={stream_names}"
+    url = f"{url}?streams={stream_names}"
 
     async for attempt in AsyncRetrying(
         stop=stop_after_attempt(5),
@@ -30,6 +37,8 @@ async def subscribe_book_ticker(symbols: List[str]) -> AsyncIterator[Dict]:
         retry=retry_if_exception_type(Exception),
     ):
         with attempt:
+            if attempt.retry_state.attempt_number > 1:
+                METRICS.ws_reconnects += 1
             ws = await _connect(url)
             try:
                 async for message in ws:
@@ -39,4 +48,65 @@ async def subscribe_book_ticker(symbols: List[str]) -> AsyncIterator[Dict]:
                 await ws.close()
 
 
-__all__ = ["subscribe_book_ticker"]
+async def _call(fn, *args):
+    """Await ``fn`` directly if async, else run the blocking call in a thread."""
+    if asyncio.iscoroutinefunction(fn):
+        return await fn(*args)
+    return await asyncio.to_thread(fn, *args)
+
+
+async def _keepalive(client: Client | RestScheduler, listen_key: str, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await _call(client.stream_keepalive, listen_key)
+
+
+async def subscribe_user_data(
+    client: Client | RestScheduler,
+    url: str = BINANCE_WS_RAW,
+    keepalive: float = LISTEN_KEY_KEEPALIVE_SEC,
+    max_backoff: float = 30.0,
+) -> AsyncIterator[Dict]:
+    """Yield user-data events (``executionReport``, ``outboundAccountPosition``...).
+
+    A listen key is requested from ``client`` (a python-binance ``Client``
+    or a :class:`RestScheduler`) for each connection and kept
+    alive in the background.  ``listenKeyExpired`` and server closes are
+    routine and reconnect at once with a fresh key; failed connects and
+    sessions that end before delivering anything back off exponentially up
+    to ``max_backoff``.  The stream never gives up on its own.
+    """
+    failures = 0
+    connected = False
+    while True:
+        if failures:
+            await asyncio.sleep(min(max_backoff, 2 ** (failures - 1)))
+        if connected:
+            METRICS.ws_reconnects += 1
+        try:
+            listen_key = await _call(client.stream_get_listen_key)
+            ws = await _connect(f"{url}/{listen_key}")
+        except Exception as exc:
+            failures += 1
+            logger.warning(f"[USERDATA] connect failed ({failures}): {exc!r}")
+            continue
+        connected = True
+        delivered = False
+        pinger = asyncio.create_task(_keepalive(client, listen_key, keepalive))
+        try:
+            async for message in ws:
+                event = json.loads(message)
+                if event.get("e") == "listenKeyExpired":
+                    logger.info("[USERDATA] listen key expired, reconnecting")
+                    break
+                delivered = True
+                yield event
+        except websockets.ConnectionClosed as exc:
+            logger.warning(f"[USERDATA] connection lost: {exc!r}")
+        finally:
+            pinger.cancel()
+            await ws.close()
+        failures = 0 if delivered else failures + 1
+
+
+__all__ = ["subscribe_book_ticker", "subscribe_user_data"]
@@ -4,9 +4,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_DOWN
 
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
-from binance.client import Client
+if TYPE_CHECKING:
+    from binance.client import Client
 
 
 @dataclass
@@ -23,23 +24,17 @@ def _float(v: str) -> float:
 
 def fetch_symbol_filters(client: Client, symbols: list[str]) -> Dict[str, SymbolFilters]:
     """Fetch exchangeInfo and build filters for given symbols."""
-    info = client.get_exchange_info()
+    return parse_symbol_filters(client.get_exchange_info(), symbols)
+
+
+def parse_symbol_filters(info: dict, symbols: list[str]) -> Dict[str, SymbolFilters]:
+    """Build filters for ``symbols`` from an exchangeInfo response."""
     filters: Dict[str, SymbolFilters] = {}
     for s in info["symbols"]:
         symbol = s["symbol"]
         if symbol not in symbols:
             continue
         fs = {f["filterType"]: f for f in s["filters"]}
-        lot = fs.get("LOT_SIZE")
-        tick = fs.get("PRICE_FILTER")
-        min_notional = fs.get("MIN_NOTIONAL")
-        if not (lot and tick and min_notional):
-            raise ValueError(f"Missing filters for {symbol}")
-        filters[symbol] = SymbolFilters(
-            tick_size=_float(tick["tickSize"]),
-            step_size=_float(lot["stepSize"]),
-            min_qty=_float(lot["minQty"]),
-            min_notional=_float(min_notional.get("minNotional", "0")),
         lot = fs.get("LOT_SIZE", {})
         tick = fs.get("PRICE_FILTER", {})
         min_notional = fs.get("MIN_NOTIONAL", {}).get("minNotional", 0)
@@ -97,24 +92,8 @@ class SymbolCache:
         if qty < self.min_qty(symbol):
             return False
         if qty * price < self.min_notional(symbol):
-
-    def format_price(self, symbol: str, price: float) -> float:
-        f = self.filters[symbol]
-        step = f.tick_size
-        return round(price / step) * step
-
-    def format_qty(self, symbol: str, qty: float) -> float:
-        f = self.filters[symbol]
-        step = f.step_size
-        return round(qty / step) * step
-
-    def validate(self, symbol: str, qty: float, price: float) -> bool:
-        f = self.filters[symbol]
-        if qty < f.min_qty:
-            return False
-        if qty * price < f.min_notional:
             return False
         return True
 
 
-__all__ = ["SymbolFilters", "fetch_symbol_filters", "SymbolCache"]
+__all__ = ["SymbolFilters", "fetch_symbol_filters", "parse_symbol_filters", "SymbolCache"]
@@ -0,0 +1,131 @@
+"""Chunked tick file reader with background prefetch for backtests."""
+from __future__ import annotations
+
+import glob
+import queue
+import threading
+from typing import TYPE_CHECKING, Iterable, Iterator, List, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+T = TypeVar("T")
+
+TICK_DTYPES = {"ts": "float64", "bid": "float64", "ask": "float64", "volume": "float64"}
+DEFAULT_CHUNK_ROWS = 100_000
+
+
+class Tick(NamedTuple):
+    ts: float
+    symbol: str
+    bid: float
+    ask: float
+    volume: float
+
+
+def expand_paths(pattern: str | Iterable[str]) -> List[str]:
+    """Resolve a path, glob or list of either into a sorted file list.
+
+    Multi-day files named by date (``BTCUSDT-2024-01-*.csv.gz``) sort into
+    chronological order.
+    """
+    patterns = [pattern] if isinstance(pattern, str) else list(pattern)
+    paths: List[str] = []
+    for p in patterns:
+        matches = sorted(glob.glob(p))
+        if not matches:
+            raise FileNotFoundError(p)
+        paths.extend(matches)
+    return paths
+
+
+def iter_chunks(paths: Iterable[str], chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Yield DataFrame chunks of at most ``chunk_rows`` from each file in turn.
+
+    Plain and gzip CSVs are supported (compression is inferred from the
+    extension).  Columns are parsed with fixed ``float64`` dtypes to skip
+    pandas' type sniffing.
+    """
+    import pandas as pd
+
+    for path in paths:
+        reader = pd.read_csv(path, dtype=TICK_DTYPES, chunksize=chunk_rows, compression="infer")
+        with reader:
+            yield from reader
+
+
+class _Done:
+    pass
+
+
+def prefetch(source: Iterator[T], depth: int = 2) -> Iterator[T]:
+    """Consume ``source`` on a background thread, ``depth`` items ahead.
+
+    The bounded queue caps memory at ``depth`` pending items.  Exceptions in
+    the worker are re-raised in the consumer; closing the generator early
+    stops the worker.
+    """
+    q: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = _Done()
+
+    def _put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _worker() -> None:
+        try:
+            for item in source:
+                if not _put(item):
+                    return
+        except BaseException as exc:  # propagate to consumer
+            _put(exc)
+        _put(done)
+
+    thread = threading.Thread(target=_worker, name="tick-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = q.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def read_ticks(
+    pattern: str | Iterable[str],
+    symbol: str,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    prefetch_depth: int = 2,
+) -> Iterator[Tick]:
+    """Stream ticks for ``symbol`` from CSV/CSV.gz files matching ``pattern``.
+
+    The next chunk is read and parsed on a background thread while the
+    current one is consumed, so peak memory stays around
+    ``(prefetch_depth + 1) * chunk_rows`` rows regardless of input size.
+    Files without a ``ts`` column get a running row number instead.
+    """
+    chunks = iter_chunks(expand_paths(pattern), chunk_rows)
+    if prefetch_depth > 0:
+        chunks = prefetch(chunks, prefetch_depth)
+    row = 0
+    for chunk in chunks:
+        n = len(chunk)
+        ts = chunk["ts"].tolist() if "ts" in chunk else range(row, row + n)
+        volume = chunk["volume"].fillna(0.0).tolist() if "volume" in chunk else [0.0] * n
+        for t, bid, ask, vol in zip(ts, chunk["bid"].tolist(), chunk["ask"].tolist(), volume):
+            yield Tick(float(t), symbol, bid, ask, vol)
+        row += n
+
+
+__all__ = ["DEFAULT_CHUNK_ROWS", "TICK_DTYPES", "Tick", "expand_paths", "iter_chunks", "prefetch", "read_ticks"]
@@ -1,2 +1,56 @@
-import sys, os
+import math
+import os
+import sys
+
+import pytest
+
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from bot.config import Config  # noqa: E402
+from bot.executor import Executor  # noqa: E402
+from bot.risk import RiskManager  # noqa: E402
+from bot.strategy import FabioStrategy  # noqa: E402
+from bot.symbols import SymbolCache, SymbolFilters  # noqa: E402
+
+SYMBOLS = ("BTCUSDT", "ETHUSDT")
+
+
+@pytest.fixture
+def filters():
+    """Exchange filters for the test symbols, keyed by symbol."""
+    f = SymbolFilters(tick_size=0.01, step_size=0.00001, min_qty=0.00001, min_notional=5.0)
+    return {s: f for s in SYMBOLS}
+
+
+@pytest.fixture
+def make_strategy(filters):
+    """Build a paper ``FabioStrategy`` over the test filters."""
+
+    def make(cfg=None, journal=None):
+        cfg = cfg or Config()
+        cache = SymbolCache(filters)
+        return FabioStrategy(cfg, cache, Executor(cache, cfg), RiskManager(cfg), journal)
+
+    return make
+
+
+@pytest.fixture
+def sine_prices():
+    """Mid prices oscillating ``amp`` around 100, enough to trigger entries and exits."""
+
+    def prices(n, amp=0.002, period=4.0):
+        return [100 * (1 + amp * math.sin(i / period)) for i in range(n)]
+
+    return prices
+
+
+@pytest.fixture
+def write_ticks():
+    """Write ``ts,bid,ask,volume`` rows with a 0.02 spread around each mid price."""
+
+    def write(path, prices, start=0.0, step=1.0):
+        rows = [f"{start + i * step},{px - 0.01},{px + 0.01},1" for i, px in enumerate(prices)]
+        path.write_text("ts,bid,ask,volume\n" + "\n".join(rows) + "\n")
+        return str(path)
+
+    return write
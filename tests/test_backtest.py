@@ -0,0 +1,52 @@
+import math
+
+from bot.backtest import backtest_portfolio, merge_ticks
+from bot.config import Config
+
+
+def test_merge_ticks_orders_by_timestamp(tmp_path, write_ticks):
+    a, b = tmp_path / "a.csv", tmp_path / "b.csv"
+    write_ticks(a, [100.0] * 3, start=0.0, step=2.0)
+    write_ticks(b, [200.0] * 3, start=1.0, step=2.0)
+    ticks = list(merge_ticks({"AAA": str(a), "BBB": str(b)}))
+    assert [t.ts for t in ticks] == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    assert [t.symbol for t in ticks] == ["AAA", "BBB"] * 3
+
+
+def test_backtest_portfolio_shares_risk(tmp_path, monkeypatch, filters, write_ticks):
+    monkeypatch.chdir(tmp_path)
+    files = {}
+    for i, sym in enumerate(["BTCUSDT", "ETHUSDT"]):
+        path = tmp_path / f"{sym}.csv"
+        prices = [100.0 * (1 + i) * (1 + 0.001 * math.sin(k / 3)) for k in range(120)]
+        write_ticks(path, prices, start=1_700_000_000 + i * 0.5)
+        files[sym] = str(path)
+    res = backtest_portfolio(files, Config(), filters)
+
+    assert res["ticks"] == 240
+    assert res["max_open_positions"] <= Config().MAX_OPEN_TRADES
+    assert set(res["symbols"]) == set(files)
+    per_symbol = sum(s["trades"] for s in res["symbols"].values())
+    assert res["combined"]["trades"] == per_symbol > 0
+    assert math.isclose(
+        res["combined"]["realized"],
+        res["day_pnl"],
+        abs_tol=1e-9,
+    )
+
+
+def test_backtest_portfolio_drawdown_stops_every_symbol(tmp_path, monkeypatch, filters, write_ticks, sine_prices):
+    monkeypatch.chdir(tmp_path)
+    files = {}
+    for i, sym in enumerate(["BTCUSDT", "ETHUSDT"]):
+        files[sym] = write_ticks(tmp_path / f"{sym}.csv", sine_prices(400), start=1_700_000_000 + i * 0.5)
+    cfg = Config(DAILY_MAX_DD_USDT=0.001, COOLDOWN_SEC=0)
+    res = backtest_portfolio(files, cfg, filters)
+
+    # the first losing exit trips the limit; nothing is bought afterwards
+    assert res["ticks"] == 800
+    first_loss = next(t for t in res["trades"] if t.side == "SELL" and t.pnl < 0)
+    late_buys = [t for t in res["trades"] if t.side == "BUY" and t.ts > first_loss.ts]
+    assert late_buys == []
+    assert res["max_drawdown"] <= -cfg.DAILY_MAX_DD_USDT
+    assert cfg.WATCHLIST != list(files)  # caller's config is left alone
@@ -0,0 +1,74 @@
+from bot.book import PositionBook
+from bot.config import Config
+from bot.risk import Position, RiskManager
+from bot.scoring import ScoreResult
+
+
+def _pos(entry, stop, tp, symbol="BTCUSDT"):
+    return Position(symbol, "LONG", entry, stop, tp, 1.0)
+
+
+def test_book_respects_max_open():
+    book = PositionBook(2)
+    assert book.add(_pos(100, 99, 101))
+    assert book.add(_pos(100, 99, 101, "ETHUSDT"))
+    assert book.full
+    assert not book.add(_pos(100, 99, 101))
+    assert len(book) == 2
+
+
+def test_triggered_only_returns_crossed_levels():
+    book = PositionBook(10)
+    low = _pos(100, 98, 103)
+    high = _pos(101, 99.5, 102)
+    book.add(low)
+    book.add(high)
+
+    assert book.triggered("BTCUSDT", 100) == []
+    assert book.triggered("BTCUSDT", 99.5) == [high]
+    assert book.triggered("BTCUSDT", 102.5) == [high]
+    assert set(p.pid for p in book.triggered("BTCUSDT", 97)) == {low.pid, high.pid}
+
+    book.remove(high)
+    assert book.triggered("BTCUSDT", 99.5) == []
+    assert "BTCUSDT" in book
+
+
+def test_trailing_stop_reindexes():
+    risk = RiskManager(Config())
+    book = PositionBook(10)
+    pos = _pos(100, 99.8, 105)
+    book.add(pos)
+
+    candidates = book.in_profit("BTCUSDT", 100.5, risk.config.TRAIL_START_BPS)
+    assert candidates == [pos]
+    risk.trailing_stop(pos, 100.5, book)
+    assert pos.stop > 100
+    assert book.triggered("BTCUSDT", 100.1) == [pos]
+    assert book.triggered("BTCUSDT", 99.9) == [pos]
+    assert book.triggered("BTCUSDT", pos.stop + 0.01) == []
+
+
+def test_reduce_removes_when_flat():
+    book = PositionBook(10)
+    pos = _pos(100, 99, 101)
+    book.add(pos)
+    book.reduce(pos, 0.4)
+    assert pos in book and abs(pos.qty - 0.6) < 1e-12
+    book.reduce(pos, 0.6)
+    assert pos not in book and len(book) == 0
+
+
+def test_held_symbol_scales_in_only_past_gap_and_cap(make_strategy):
+    strat = make_strategy(Config(MAX_OPEN_TRADES=5, MAX_SCALE_INS=1, SCALE_IN_BPS=20))
+    a = ScoreResult("BTCUSDT", 0.9, "A", {})
+
+    def tick(mid):
+        return strat.decide("BTCUSDT", mid - 0.01, mid + 0.01, 0.1, a)
+
+    assert tick(100.0) is not None
+    assert tick(100.0) is None  # held: no re-entry on the next tick
+    assert tick(100.1) is None  # 10 bps is inside the gap
+    assert tick(100.25) is not None
+    assert tick(100.25) is None  # cap reached
+    assert len(strat.positions) == 2
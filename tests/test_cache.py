@@ -0,0 +1,61 @@
+from bot.backtest import backtest_portfolio
+from bot.cache import ResultCache
+from bot.config import Config
+
+
+def _sawtooth(n):
+    return [100.0 + i % 7 for i in range(n)]
+
+
+def test_backtest_result_cache_hits_and_invalidates(tmp_path, monkeypatch, filters, write_ticks):
+    monkeypatch.chdir(tmp_path)
+    data = tmp_path / "btc.csv"
+    write_ticks(data, _sawtooth(60))
+    cache = ResultCache(str(tmp_path / "cache"), 10 * 1024 * 1024)
+    files = {"BTCUSDT": str(data)}
+
+    first = backtest_portfolio(files, Config(), filters, cache=cache)
+    second = backtest_portfolio(files, Config(), filters, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second["combined"] == first["combined"]
+    assert len(second["trades"]) == len(first["trades"])
+
+    # irrelevant fields share the entry, strategy parameters do not
+    backtest_portfolio(files, Config(DEBUG=True), filters, cache=cache)
+    backtest_portfolio(files, Config(PROFIT_TAKE_BPS=50), filters, cache=cache)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    write_ticks(data, _sawtooth(61))
+    backtest_portfolio(files, Config(), filters, cache=cache)
+    assert cache.misses == 3
+    assert cache.stats()["entries"] == 3
+
+
+def test_cache_key_follows_file_order(tmp_path, filters, write_ticks):
+    a = write_ticks(tmp_path / "a.csv", _sawtooth(5))
+    b = write_ticks(tmp_path / "b.csv", _sawtooth(5))
+    cache = ResultCache(str(tmp_path / "cache"), 1024 * 1024)
+    # merge_ticks breaks timestamp ties by file order, so it is part of the key
+    forward = cache.key({"BTCUSDT": a, "ETHUSDT": b}, Config(), filters)
+    backward = cache.key({"ETHUSDT": b, "BTCUSDT": a}, Config(), filters)
+    assert forward != backward
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path), 2500)
+    for key in ("a", "b", "c"):
+        cache.put(key, {"blob": "x" * 1000})
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    assert cache.stats()["entries"] == 2
+
+
+def test_cache_does_not_import_live_modules():
+    import os
+    import subprocess
+    import sys
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    probe = "import sys, bot.cache; print(sorted(m for m in ('bot.checkpoint', 'bot.strategy') if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", probe], cwd=root, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,67 @@
+import math
+import pickle
+import time
+
+from bot import checkpoint
+from bot.risk import Position
+
+
+def test_checkpoint_round_trip(tmp_path, monkeypatch, make_strategy):
+    monkeypatch.chdir(tmp_path)
+    strat = make_strategy()
+    for i in range(40):
+        strat.indicators["BTCUSDT"].update(100.0 + i, 1.0)
+    strat.positions.add(Position("BTCUSDT", "LONG", 100.0, 99.0, 101.0, 0.1))
+    strat.risk.day_pnl = -0.5
+    strat.risk.max_drawdown = -0.7
+
+    path = str(tmp_path / "state" / "cp.pkl")
+    checkpoint.save(path, checkpoint.snapshot(strat))
+
+    fresh = make_strategy()
+    checkpoint.restore(fresh, checkpoint.load(path))
+    restored = fresh.indicators["BTCUSDT"]
+    assert restored.count == 40 and restored.last_price == 139.0
+    assert restored.rsi == strat.indicators["BTCUSDT"].rsi
+    assert [p.stop for p in fresh.positions.for_symbol("BTCUSDT")] == [99.0]
+    assert math.isclose(fresh.risk.day_pnl, -0.5)
+
+
+def test_restore_drops_previous_day_risk(tmp_path, monkeypatch, make_strategy):
+    monkeypatch.chdir(tmp_path)
+    strat = make_strategy()
+    strat.risk.day_pnl = -1.0
+    state = checkpoint.snapshot(strat)
+    state["saved_at"] = time.time() - 2 * 86400
+
+    fresh = make_strategy()
+    checkpoint.restore(fresh, state)
+    assert fresh.risk.day_pnl == 0.0
+
+
+def test_load_missing_returns_none(tmp_path):
+    assert checkpoint.load(str(tmp_path / "nope.pkl")) is None
+
+
+def test_restore_drops_stale_indicators(tmp_path, monkeypatch, make_strategy):
+    monkeypatch.chdir(tmp_path)
+    strat = make_strategy()
+    for i in range(40):
+        strat.indicators["BTCUSDT"].update(100.0 + i, 1.0)
+    strat.positions.add(Position("BTCUSDT", "LONG", 100.0, 99.0, 101.0, 0.1))
+    state = checkpoint.snapshot(strat)
+    state["saved_at"] -= strat.config.CHECKPOINT_MAX_AGE_SEC + 1
+
+    fresh = make_strategy()
+    checkpoint.restore(fresh, state)
+    assert fresh.indicators["BTCUSDT"].count == 0
+    assert len(fresh.positions) == 1
+
+
+def test_load_rejects_foreign_pickles(tmp_path):
+    path = tmp_path / "cp.pkl"
+    path.write_bytes(pickle.dumps([1, 2, 3]))
+    assert checkpoint.load(str(path)) is None
+    # a class that no longer exists where it was pickled from
+    path.write_bytes(b"cbot.risk\nGone\n.")
+    assert checkpoint.load(str(path)) is None
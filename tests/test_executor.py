@@ -1,7 +1,11 @@
+import asyncio
 import math
 
-from bot.executor import _quantize, size_position
-from bot.symbols import SymbolFilters
+import pytest
+
+from bot.account import AccountState
+from bot.executor import Executor, _quantize, size_position
+from bot.symbols import SymbolCache
 from bot.config import Config
 
 
@@ -9,13 +13,48 @@ def test_quantize_floor():
     assert math.isclose(_quantize(1.2345, 0.01), 1.23)
 
 
-def test_size_position_respects_filters():
+def test_size_position_respects_filters(filters):
     cfg = Config()
-    filters = {
-        "BTCUSDT": SymbolFilters(
-            tick_size=0.01, step_size=0.00001, min_qty=0.00001, min_notional=5.0
-        )
-    }
     qty, reason = size_position("BTCUSDT", 20000, cfg, filters)
     assert reason == ""
     assert qty > 0
+
+
+class FakeRest:
+    def __init__(self, account=None):
+        self.account = account
+        self.orders = []
+
+    async def get_symbol_ticker(self, symbol):
+        return {"symbol": symbol, "price": "20000.005"}
+
+    async def create_order(self, **params):
+        self.orders.append(params)
+        if params["quantity"] > 1:
+            report = {"X": "REJECTED", "x": "REJECTED", "z": "0", "Z": "0", "l": "0", "L": "0", "n": "0", "N": ""}
+        else:
+            report = {"X": "FILLED", "x": "TRADE", "z": "0.001", "Z": "20.0", "l": "0.001", "L": "20000", "n": "0.02", "N": "USDT"}
+        self.account.apply({
+            "e": "executionReport", "E": 1, "s": params["symbol"], "S": params["side"], "i": len(self.orders),
+            **report,
+        })
+        return {"orderId": len(self.orders)}
+
+
+def test_orders_go_through_the_rest_scheduler(filters):
+    filters = SymbolCache(filters)
+    paper = Executor(filters, Config(), rest=FakeRest())
+    fill = asyncio.run(paper.market_order("BTCUSDT", "BUY", 0.001))
+    assert not fill.executed and fill.price == 20000.0
+
+    account = AccountState()
+    rest = FakeRest(account)
+    live = Executor(filters, Config(LIVE=True), account, rest)
+    fill = asyncio.run(live.market_order("BTCUSDT", "BUY", 0.001))
+    assert fill.executed and fill.qty == 0.001 and fill.fee == 0.02
+    assert rest.orders[0]["newOrderRespType"] == "ACK"
+    rejected = asyncio.run(live.market_order("BTCUSDT", "BUY", 5.0))
+    assert not rejected.executed and rejected.qty == 0.0
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(Executor(filters, Config()).market_order("BTCUSDT", "BUY", 0.001))
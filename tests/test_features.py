@@ -0,0 +1,61 @@
+from bot.backtest import backtest_portfolio
+from bot.config import Config
+from bot.features import build_features, feature_dir, load_features
+
+
+def test_feature_replay_matches_direct_replay(tmp_path, monkeypatch, filters, sine_prices, write_ticks):
+    monkeypatch.chdir(tmp_path)
+    data = tmp_path / "btc.csv"
+    write_ticks(data, sine_prices(150))
+    files = {"BTCUSDT": str(data)}
+
+    direct = backtest_portfolio(files, Config(BACKTEST_FEATURES=False), filters)
+    assert load_features(str(data)) is None
+    featured = backtest_portfolio(files, Config(BACKTEST_FEATURES=True), filters)
+    cols = load_features(str(data))
+    assert cols is not None and len(cols["ts"]) == 150
+
+    assert direct["combined"]["trades"] > 0
+    assert featured["combined"] == direct["combined"]
+    assert [(t.side, t.price) for t in featured["trades"]] == [(t.side, t.price) for t in direct["trades"]]
+    # exit parameters do not invalidate the store
+    backtest_portfolio(files, Config(PROFIT_TAKE_BPS=10), filters)
+    assert load_features(str(data)) is not None
+
+
+def test_feature_store_invalidated_when_data_changes(tmp_path, sine_prices, write_ticks):
+    data = tmp_path / "btc.csv"
+    write_ticks(data, sine_prices(150))
+    first = feature_dir(str(data))
+    write_ticks(data, sine_prices(151))
+    assert feature_dir(str(data)) != first
+
+
+def test_concurrent_builders_do_not_clobber_each_other(tmp_path, sine_prices, write_ticks):
+    data = tmp_path / "btc.csv"
+    write_ticks(data, sine_prices(150))
+    target = feature_dir(str(data))
+    target.parent.mkdir(parents=True)
+    (target.parent / "oldkey").mkdir()
+    in_progress = target.parent / f"{target.name}.abc123.tmp"
+    in_progress.mkdir()
+
+    assert build_features(str(data), "BTCUSDT") == target
+    # a second worker finishing the same key treats the published store as done
+    assert build_features(str(data), "BTCUSDT") == target
+    assert load_features(str(data)) is not None
+    assert in_progress.exists()
+    assert not (target.parent / "oldkey").exists()
+    assert sorted(p.name for p in target.parent.iterdir()) == sorted([target.name, in_progress.name])
+
+
+def test_unwritable_feature_store_falls_back_to_ticks(tmp_path, monkeypatch, filters, sine_prices, write_ticks):
+    monkeypatch.chdir(tmp_path)
+    data = tmp_path / "btc.csv"
+    write_ticks(data, sine_prices(150))
+    (tmp_path / ".features").write_text("")  # store directory cannot be created
+    files = {"BTCUSDT": str(data)}
+
+    direct = backtest_portfolio(files, Config(BACKTEST_FEATURES=False), filters)
+    fallback = backtest_portfolio(files, Config(BACKTEST_FEATURES=True), filters)
+    assert fallback["combined"] == direct["combined"]
@@ -0,0 +1,70 @@
+import asyncio
+import json
+import time
+
+import websockets
+
+from bot import main
+from bot.config import Config
+from bot.host import StrategyHost
+from bot.metrics import METRICS
+from bot.symbols import SymbolCache
+
+
+def test_host_shares_indicators_and_isolates_variants(filters, make_strategy, sine_prices):
+    # ticks arrive faster than wall-clock cooldowns expire
+    base = Config(WATCHLIST=["BTCUSDT"], COOLDOWN_SEC=0)
+    host = StrategyHost(
+        base, SymbolCache(filters), {"base": {}, "wide": {"STOP_LOSS_BPS": 80, "PROFIT_TAKE_BPS": 5}}
+    )
+    solo = make_strategy(base)
+
+    for mid in sine_prices(200):
+        host.on_tick("BTCUSDT", mid - 0.01, mid + 0.01)
+        solo.on_tick("BTCUSDT", mid - 0.01, mid + 0.01)
+
+    assert host.indicators["BTCUSDT"].count == 200
+    base_v, wide_v = host.variants
+    assert base_v.strategy.indicators == {}
+    assert base_v.risk is not wide_v.risk
+    assert base_v.risk.day_pnl == solo.risk.day_pnl
+    assert base_v.portfolio.summary()["trades"] > 0
+    assert host.summary()["wide"]["day_pnl"] != host.summary()["base"]["day_pnl"]
+
+
+def test_run_modes_share_rest_budget_and_feed_consumer(monkeypatch):
+    created = []
+
+    class FakeRest:
+        def __init__(self, *args):
+            created.append(args)
+
+        async def start(self):
+            return self
+
+        async def get_exchange_info(self):
+            return {"symbols": []}
+
+    monkeypatch.setattr(main, "RestScheduler", FakeRest)
+    cfg = Config(REST_WEIGHT_LIMIT=1200, WATCHLIST=["BTCUSDT"])
+
+    async def scenario():
+        await main._start_rest(cfg)
+
+        async def handler(ws):
+            for i in range(3):
+                data = {"s": "BTCUSDT", "b": "100.0", "a": "100.02", "E": time.time() * 1000}
+                await ws.send(json.dumps({"stream": "btcusdt@bookTicker", "data": data}))
+
+        seen = []
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            run_cfg = Config(WATCHLIST=["BTCUSDT"], BINANCE_WS=f"ws://127.0.0.1:{port}/stream")
+            await main.consume_book_ticker(run_cfg, lambda *tick: seen.append(tick))
+        return seen
+
+    lags = METRICS.tick_lag_count
+    seen = asyncio.run(scenario())
+    assert created[0][-1] == 1200
+    assert seen == [("BTCUSDT", 100.0, 100.02)] * 3
+    assert METRICS.tick_lag_count == lags + 3
@@ -0,0 +1,32 @@
+import math
+import random
+
+import pandas as pd
+
+from bot.indicators import IndicatorState, ma, macd, rsi, vwap
+
+
+def test_indicator_state_matches_series_functions():
+    rng = random.Random(7)
+    prices, volumes = [100.0], [1.0]
+    for _ in range(299):
+        prices.append(prices[-1] * (1 + rng.gauss(0, 0.002)))
+        volumes.append(rng.random())
+    state = IndicatorState()
+    for px, vol in zip(prices, volumes):
+        state.update(px, vol)
+
+    df = pd.DataFrame({"price": prices, "volume": volumes})
+    series = df["price"]
+    assert math.isclose(state.rsi, rsi(series).iloc[-1], rel_tol=1e-9)
+    assert math.isclose(state.macd_hist, macd(series)[2].iloc[-1], rel_tol=1e-6, abs_tol=1e-12)
+    assert math.isclose(state.ma, ma(series, 200).iloc[-1], rel_tol=1e-9)
+    assert math.isclose(state.vwap, vwap(df).iloc[-1], rel_tol=1e-9)
+
+
+def test_indicator_state_undefined_values_are_nan():
+    state = IndicatorState()
+    state.update(100.0)
+    assert math.isnan(state.rsi)
+    assert math.isnan(state.ma)
+    assert math.isnan(state.vwap)
@@ -0,0 +1,91 @@
+import csv
+import time
+from datetime import datetime, timezone
+
+from bot import journal, main
+from bot.config import Config
+from bot.journal import Journal
+from bot.metrics import METRICS
+from bot.scoring import ScoreResult
+
+
+def test_journal_batches_and_queries(tmp_path):
+    path = str(tmp_path / "state" / "journal.db")
+    now = time.time()
+    with Journal(path, batch_size=3, flush_sec=10) as j:
+        j.trade("BTCUSDT", "BUY", 0.1, 100.0, 0.01, ts=now)
+        j.trade("BTCUSDT", "SELL", 0.1, 98.0, 0.01, -0.3, ts=now + 1)
+        j.trade("ETHUSDT", "SELL", 1.0, 10.0, 0.01, 0.5, ts=now + 2)
+        j.decision("BTCUSDT", "SKIP", 100.0, reason="grade", grade="C", score=0.2, ts=now)
+        j.decision("ETHUSDT", "SKIP", 10.0, reason="grade", ts=now)
+        # the last partial batch is written on close
+    assert j.dropped == 0
+
+    conn = journal.connect(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+    assert journal.day_risk(path) == (0.2, -0.3)
+    s = journal.summary(path, symbol="BTCUSDT")
+    assert s["trades"] == 2 and s["wins"] == 0 and s["skips"] == {"grade": 1}
+    assert journal.summary(path)["skips"] == {"grade": 2}
+
+    out = tmp_path / "trades.csv"
+    assert journal.export_csv(path, str(out)) == 3
+    rows = list(csv.reader(out.open()))
+    assert rows[0] == ["ts", "symbol", "side", "qty", "price", "fee", "pnl"]
+    assert datetime.fromisoformat(rows[1][0]).tzinfo == timezone.utc
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    j = Journal(str(tmp_path / "j.db"), max_queue=2)  # writer not started
+    for _ in range(5):
+        j.decision("BTCUSDT", "SKIP", 1.0, reason="max_open")
+    assert j.dropped == 3
+
+
+def test_strategy_journals_decisions(tmp_path, make_strategy):
+    path = str(tmp_path / "j.db")
+    with Journal(path) as j:
+        strat = make_strategy(Config(WATCHLIST=["BTCUSDT"], MAX_OPEN_TRADES=1), j)
+        a = ScoreResult("BTCUSDT", 0.9, "A", {})
+        assert strat.decide("BTCUSDT", 100.0, 100.02, 0.1, a) is not None
+        eth = ScoreResult("ETHUSDT", 0.9, "A", {})
+        for _ in range(50):
+            strat.decide("ETHUSDT", 100.0, 100.02, 0.1, eth)  # book full, journaled once
+        strat.decide("ETHUSDT", 100.0, 100.02, 0.1, ScoreResult("ETHUSDT", -0.5, "C", {}))  # grade, not max_open
+        strat.decide("BTCUSDT", 90.0, 90.02, -0.1, a)  # MACD exit at a loss
+    conn = journal.connect(path)
+    actions = conn.execute("SELECT action, reason FROM decisions ORDER BY id").fetchall()
+    sides = [r[0] for r in conn.execute("SELECT side FROM trades ORDER BY id")]
+    conn.close()
+    assert actions == [("BUY", ""), ("SKIP", "max_open"), ("SKIP", "grade"), ("SELL", "")]
+    assert sides == ["BUY", "SELL"]
+    assert journal.day_risk(path) == (strat.risk.day_pnl, strat.risk.max_drawdown)
+
+
+def test_skips_alternating_reasons_are_each_rate_limited(tmp_path, make_strategy):
+    path = str(tmp_path / "j.db")
+    with Journal(path) as j:
+        strat = make_strategy(Config(WATCHLIST=["BTCUSDT"], MAX_OPEN_TRADES=1), j)
+        a = ScoreResult("BTCUSDT", 0.9, "A", {})
+        strat.decide("BTCUSDT", 100.0, 100.02, 0.1, a)
+        for _ in range(20):
+            strat.decide("ETHUSDT", 100.0, 100.02, 0.1, ScoreResult("ETHUSDT", 0.9, "A", {}))
+            strat.decide("ETHUSDT", 100.0, 100.02, 0.1, ScoreResult("ETHUSDT", -0.5, "C", {}))
+    assert journal.summary(path)["skips"] == {"grade": 1, "max_open": 1}
+
+
+def test_breached_day_in_journal_blocks_entries(tmp_path, make_strategy, sine_prices):
+    path = str(tmp_path / "j.db")
+    with Journal(path) as j:
+        j.trade("BTCUSDT", "SELL", 0.1, 100.0, 0.01, pnl=-5.0)
+    cfg = Config(
+        WATCHLIST=["BTCUSDT"], JOURNAL_PATH=path, CHECKPOINT_PATH=str(tmp_path / "none.pkl"), DAILY_MAX_DD_USDT=2.0
+    )
+    strat = make_strategy(cfg)
+    main._restore(cfg, strat)
+
+    before = METRICS.skips["cooldown"]
+    opened = [strat.on_tick("BTCUSDT", px - 0.01, px + 0.01) for px in sine_prices(200)]
+    assert opened == [None] * 200
+    assert METRICS.skips["cooldown"] > before
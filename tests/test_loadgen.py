@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+import websockets
+
+from bot.loadgen import BurstProfile, bench, random_walk, serve, synthetic_symbols
+
+
+def test_burst_profile():
+    profile = BurstProfile.parse("5x:1/10")
+    assert profile.rate(100, 0.5) == 500
+    assert profile.rate(100, 3.0) == 100
+    assert profile.rate(100, 10.2) == 500
+    assert BurstProfile.parse("steady").rate(100, 0.5) == 100
+
+
+def test_bench_against_local_feed():
+    symbols = synthetic_symbols(3)
+
+    async def scenario():
+        ready = asyncio.get_running_loop().create_future()
+        server = asyncio.create_task(
+            serve("127.0.0.1", 0, symbols, random_walk, 500, BurstProfile(), 0.5, ready)
+        )
+        port = await ready
+        # subscribe to two of three symbols; the server must filter the third
+        report = await bench(f"ws://127.0.0.1:{port}/stream", symbols[:2], 2.0)
+        return report, await server
+
+    report, stats = asyncio.run(scenario())
+    assert stats["clients"] == 1
+    assert stats["sent"] > 100
+    assert report["received"] == stats["sent"]
+    assert report["lag_max_ms"] >= report["lag_p99_ms"] >= report["lag_p50_ms"] >= 0
+
+
+def test_client_requesting_no_served_symbol_is_refused():
+    async def scenario():
+        ready = asyncio.get_running_loop().create_future()
+        server = asyncio.create_task(
+            serve("127.0.0.1", 0, synthetic_symbols(3), random_walk, 500, BurstProfile(), 0.2, ready)
+        )
+        port = await ready
+        async with websockets.connect(f"ws://127.0.0.1:{port}/stream?streams=btcusdt@bookTicker") as ws:
+            with pytest.raises(websockets.ConnectionClosed) as closed:
+                await asyncio.wait_for(ws.recv(), 2)
+        assert closed.value.rcvd.code == 1008
+        return await server
+
+    stats = asyncio.run(asyncio.wait_for(scenario(), 5))
+    assert stats["refused"] == 1 and stats["sent"] == 0
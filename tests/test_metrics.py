@@ -0,0 +1,63 @@
+import asyncio
+
+from bot.backtest import backtest_portfolio
+from bot.config import Config
+from bot.book import PositionBook
+from bot.metrics import METRICS, Metrics, render, serve_metrics
+from bot.risk import Position, RiskManager
+
+
+def test_render_prometheus_text():
+    m = Metrics()
+    m.ticks["BTCUSDT"] += 3
+    m.skips["min_notional"] += 1
+    m.observe_order("BUY", "live", 0.25)
+    risk = RiskManager(Config())
+    risk.update_pnl(-0.5)
+
+    book = PositionBook(max_open=2)
+    book.add(Position("BTCUSDT", "LONG", 100.0, 99.0, 101.0, 0.1))
+
+    text = render(m, positions=book, risk=risk)
+    assert 'bot_ticks_total{symbol="BTCUSDT"} 3' in text
+    assert 'bot_skips_total{reason="min_notional"} 1' in text
+    assert 'bot_orders_total{side="BUY",mode="live"} 1' in text
+    assert "bot_order_latency_seconds_sum 0.25" in text
+    assert "bot_open_positions 1" in text
+    assert "bot_day_pnl_usdt -0.5" in text
+    assert "process_resident_memory_bytes " in text
+
+
+def test_serve_metrics_http():
+    async def scrape():
+        server = await serve_metrics("127.0.0.1", 0, positions=PositionBook(max_open=1))
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /metrics HTTP/1.1\r\nHost: x\r\n\r\n")
+            await writer.drain()
+            raw = await reader.read()
+            writer.close()
+            return raw.decode()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    METRICS.ws_reconnects += 1
+    resp = asyncio.run(scrape())
+    assert resp.startswith("HTTP/1.1 200 OK")
+    assert "bot_ws_reconnects_total" in resp
+    assert "bot_open_positions 0" in resp
+
+
+def test_paper_orders_counted_once_per_decision(tmp_path, monkeypatch, filters, sine_prices, write_ticks):
+    monkeypatch.chdir(tmp_path)
+    path = write_ticks(tmp_path / "ticks.csv", sine_prices(200))
+
+    before = dict(METRICS.orders)
+    result = backtest_portfolio({"BTCUSDT": path}, Config(), filters)
+    sides = [t.side for t in result["trades"]]
+    assert sides
+    for side in ("BUY", "SELL"):
+        counted = METRICS.orders[(side, "sim")] - before.get((side, "sim"), 0)
+        assert counted == sides.count(side)
@@ -0,0 +1,107 @@
+import asyncio
+
+from aiohttp import web
+
+from bot.rest import RestError, RestScheduler
+
+
+class Stub:
+    """Local stand-in for the Binance REST API."""
+
+    def __init__(self, used_weight=0):
+        self.used_weight = used_weight
+        self.hits = []
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get("/api/v3/ticker/price", self.ticker)
+        app.router.add_post("/api/v3/order", self.order)
+        return app
+
+    def _headers(self):
+        return {"X-MBX-USED-WEIGHT-1M": str(self.used_weight)}
+
+    async def ticker(self, request):
+        self.hits.append(("ticker", request.query["symbol"]))
+        await asyncio.sleep(0.05)
+        return web.json_response({"symbol": request.query["symbol"], "price": "100.0"}, headers=self._headers())
+
+    async def order(self, request):
+        self.hits.append(("order", request.query.get("signature") is not None))
+        if request.query["symbol"] == "BAD":
+            return web.json_response({"code": -1121, "msg": "Invalid symbol."}, status=400)
+        return web.json_response({"orderId": 1}, headers=self._headers())
+
+
+async def _serve(stub):
+    runner = web.AppRunner(stub.app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def test_concurrent_ticker_lookups_are_coalesced():
+    async def scenario():
+        stub = Stub()
+        runner, url = await _serve(stub)
+        try:
+            async with RestScheduler(url, "k", "s") as rest:
+                results = await asyncio.gather(*(rest.get_symbol_ticker("BTCUSDT") for _ in range(5)))
+                await rest.get_symbol_ticker("ETHUSDT")
+        finally:
+            await runner.cleanup()
+        return stub, results
+
+    stub, results = asyncio.run(scenario())
+    assert [r["price"] for r in results] == ["100.0"] * 5
+    assert stub.hits == [("ticker", "BTCUSDT"), ("ticker", "ETHUSDT")]
+
+
+def test_orders_bypass_exhausted_info_budget():
+    async def scenario():
+        stub = Stub(used_weight=85)
+        runner, url = await _serve(stub)
+        try:
+            async with RestScheduler(url, "k", "s", weight_limit=100, info_headroom=0.8) as rest:
+                await rest.get_symbol_ticker("BTCUSDT")  # learns used weight = 85
+                info = asyncio.create_task(rest.get_symbol_ticker("ETHUSDT"))
+                await asyncio.sleep(0.05)
+                ack = await asyncio.wait_for(rest.create_order(symbol="BTCUSDT", side="SELL", quantity=1), 2)
+                info_pending = not info.done()
+                info.cancel()
+                try:
+                    await rest.create_order(symbol="BAD", side="SELL", quantity=1)
+                except RestError as exc:
+                    status = exc.status
+        finally:
+            await runner.cleanup()
+        return stub, ack, info_pending, status
+
+    stub, ack, info_pending, status = asyncio.run(scenario())
+    assert ack == {"orderId": 1}
+    assert info_pending
+    assert ("ticker", "ETHUSDT") not in stub.hits
+    assert ("order", True) in stub.hits
+    assert status == 400
+
+
+def test_close_fails_queued_requests():
+    async def scenario():
+        stub = Stub(used_weight=100)
+        runner, url = await _serve(stub)
+        try:
+            rest = await RestScheduler(url, "k", "s", weight_limit=100).start()
+            await rest.get_symbol_ticker("BTCUSDT")  # learns the budget is spent
+            queued = asyncio.create_task(rest.get_symbol_ticker("ETHUSDT"))
+            await asyncio.sleep(0.05)
+            await rest.close()
+            try:
+                await asyncio.wait_for(queued, 1)
+            except RuntimeError as exc:
+                return str(exc)
+        finally:
+            await runner.cleanup()
+
+    assert "closed" in asyncio.run(scenario())
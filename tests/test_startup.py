@@ -0,0 +1,27 @@
+import json
+import os
+import subprocess
+import sys
+
+# Import-time budget for the CLI entry points, in seconds.  Generous enough
+# for slow CI machines; the real guard is that heavy packages stay unloaded.
+STARTUP_BUDGET_SEC = 0.5
+HEAVY_MODULES = ("pandas", "numpy", "binance")
+
+_PROBE = """
+import json, sys, time
+t = time.perf_counter()
+import bot.main, bot.backtest
+elapsed = time.perf_counter() - t
+print(json.dumps({"elapsed": elapsed, "loaded": sorted(m for m in %r if m in sys.modules)}))
+""" % (HEAVY_MODULES,)
+
+
+def test_entry_points_import_within_budget():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=root, capture_output=True, text=True, check=True
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    assert result["loaded"] == []
+    assert result["elapsed"] < STARTUP_BUDGET_SEC, result
@@ -0,0 +1,34 @@
+import gzip
+
+import pytest
+
+from bot.ticks import prefetch, read_ticks
+
+
+def test_read_ticks_gzip_glob_across_chunks(tmp_path):
+    for day, start in (("2024-01-02", 10), ("2024-01-01", 0)):
+        rows = "".join(f"{start + i},{100 + i},{101 + i},1\n" for i in range(10))
+        with gzip.open(tmp_path / f"BTCUSDT-{day}.csv.gz", "wt") as f:
+            f.write("ts,bid,ask,volume\n" + rows)
+
+    ticks = list(read_ticks(str(tmp_path / "BTCUSDT-*.csv.gz"), "BTCUSDT", chunk_rows=3))
+    assert [t.ts for t in ticks] == [float(i) for i in range(20)]
+    assert ticks[-1].bid == 109.0 and ticks[-1].symbol == "BTCUSDT"
+
+
+def test_read_ticks_without_ts_or_volume(tmp_path):
+    path = tmp_path / "ticks.csv"
+    path.write_text("bid,ask\n1,2\n3,4\n")
+    ticks = list(read_ticks(str(path), "X", prefetch_depth=0))
+    assert [(t.ts, t.volume) for t in ticks] == [(0.0, 0.0), (1.0, 0.0)]
+
+
+def test_prefetch_reraises_worker_errors():
+    def source():
+        yield 1
+        raise ValueError("boom")
+
+    it = prefetch(source())
+    assert next(it) == 1
+    with pytest.raises(ValueError):
+        next(it)
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from contextlib import aclosing
+
+import websockets
+
+from bot.account import AccountState
+from bot.streams import subscribe_user_data
+
+
+class FakeClient:
+    def __init__(self):
+        self.keys = 0
+        self.keepalives = []
+
+    def stream_get_listen_key(self):
+        self.keys += 1
+        return f"key{self.keys}"
+
+    def stream_keepalive(self, listen_key):
+        self.keepalives.append(listen_key)
+
+
+def _report(order_id, status, exec_type, cum_qty, cum_quote, last_qty, last_px, fee):
+    return {
+        "e": "executionReport", "E": 1, "s": "BTCUSDT", "S": "BUY", "i": order_id,
+        "X": status, "x": exec_type, "z": str(cum_qty), "Z": str(cum_quote),
+        "l": str(last_qty), "L": str(last_px), "n": str(fee), "N": "BNB",
+    }
+
+
+EVENTS = {
+    "/key1": [
+        _report(7, "NEW", "NEW", 0, 0, 0, 0, 0),
+        _report(7, "PARTIALLY_FILLED", "TRADE", 0.001, 20.0, 0.001, 20000, 0.01),
+        {"e": "listenKeyExpired", "E": 2},
+    ],
+    "/key2": [
+        _report(7, "FILLED", "TRADE", 0.002, 40.2, 0.001, 20200, 0.01),
+        {"e": "outboundAccountPosition", "E": 3, "B": [{"a": "USDT", "f": "59.8", "l": "0"}]},
+    ],
+}
+
+
+def test_user_data_stream_drives_account_state():
+    async def scenario():
+        async def handler(ws):
+            for event in EVENTS[ws.request.path]:
+                await ws.send(json.dumps(event))
+            await ws.wait_closed()
+
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            client = FakeClient()
+            account = AccountState()
+            seen = 0
+            stream = subscribe_user_data(client, f"ws://127.0.0.1:{port}", keepalive=0.05)
+            async with aclosing(stream):
+                async for event in stream:
+                    account.apply(event)
+                    seen += 1
+                    if seen == 4:
+                        break
+            return client, account
+
+    client, account = asyncio.run(scenario())
+    assert client.keys == 2
+    order = account.orders[7]
+    assert order.done and order.filled_qty == 0.002
+    assert abs(order.avg_price - 20100) < 1e-9
+    assert abs(order.commission - 0.02) < 1e-12
+    assert account.free("USDT") == 59.8
+
+
+def test_wait_done_is_event_driven():
+    async def scenario():
+        account = AccountState()
+        waiter = asyncio.create_task(account.wait_done(9, timeout=1))
+        await asyncio.sleep(0)
+        account.apply(_report(9, "FILLED", "TRADE", 1, 10, 1, 10, 0))
+        return await waiter
+
+    assert asyncio.run(scenario()).status == "FILLED"
+
+
+def test_routine_expiries_do_not_exhaust_reconnects():
+    async def scenario():
+        async def handler(ws):
+            await ws.send(json.dumps({"e": "outboundAccountPosition", "E": 1, "B": []}))
+            await ws.send(json.dumps({"e": "listenKeyExpired", "E": 2}))
+            await ws.wait_closed()
+
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            client = FakeClient()
+            seen = 0
+            stream = subscribe_user_data(client, f"ws://127.0.0.1:{port}", keepalive=60)
+            async with aclosing(stream):
+                async for _ in stream:
+                    seen += 1
+                    if seen == 8:
+                        break
+            return client
+
+    assert asyncio.run(asyncio.wait_for(scenario(), 5)).keys == 8
+
+
+def test_shutdown_survives_a_dead_task():
+    from bot.main import _stop_tasks
+
+    async def boom():
+        raise RuntimeError("stream gave up")
+
+    async def idle():
+        await asyncio.sleep(10)
+
+    async def scenario():
+        dead, alive = asyncio.create_task(boom()), asyncio.create_task(idle())
+        await asyncio.sleep(0)
+        await _stop_tasks(dead, None, alive)
+        return alive.cancelled()
+
+    assert asyncio.run(scenario())